@@ -373,6 +373,32 @@ def test_load_config_applies_gui_runtime_overrides(tmp_path, monkeypatch):
     assert wand_common.get_response_map("bool") == {"g": True, "l": False}
 
 
+def test_get_text_formats_equal_values_of_different_types(monkeypatch):
+    """
+    BEHAVIOURAL: get_text must not reuse a cached result across value types.
+    """
+    from wand_nback import common as wand_common
+
+    monkeypatch.setattr(wand_common, "TEXT", {"label": "n={n}", "rate": "{v:.1f}"})
+    wand_common._format_text.cache_clear()
+
+    labels = [wand_common.get_text("label", n=v) for v in (1, 1.0, True)]
+    rates = [wand_common.get_text("rate", v=v) for v in (2, 2.0)]
+
+    log_evidence(
+        "get_text: Cache keyed on value type",
+        "n=1, n=1.0, n=True",
+        "['n=1', 'n=1.0', 'n=True']",
+        str(labels),
+        "PASS" if labels == ["n=1", "n=1.0", "n=True"] else "FAIL",
+    )
+
+    assert labels == ["n=1", "n=1.0", "n=True"]
+    assert rates == ["2.0", "2.0"]
+    # Unhashable substitutions are still formatted, just not cached
+    assert wand_common.get_text("label", n=[1]) == "n=[1]"
+
+
 def test_practice_fallback_to_default_timing(no_config):
     """
     BEHAVIOURAL: Without config, Practice uses default timings.
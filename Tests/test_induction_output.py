@@ -0,0 +1,117 @@
+"""
+Tests/test_induction_output.py
+
+Regression tests for what the induction writes to disk: the buffered session
+log and the behavioural results CSV.
+"""
+
+import csv
+import io
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+from test_induction_timing import induction
+
+# =============================================================================
+# Session log
+# =============================================================================
+
+
+def test_buffered_session_log_keeps_every_record_in_order(tmp_path):
+    """A burst through the queue listener is all on disk, in order, after stop()."""
+    log_path = tmp_path / "participant_log.txt"
+    handler = induction.BufferedFileHandler(log_path, mode="w", encoding="utf-8")
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    log_queue = queue.Queue(-1)
+    listener = induction.DrainingQueueListener(log_queue, handler)
+
+    logger = logging.getLogger("wand_test_session_log")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    logger.addHandler(queue_handler)
+    listener.start()
+    try:
+        for i in range(5000):
+            logger.info("record %d", i)
+    finally:
+        listener.stop()
+        listener.stop()  # a second stop (the atexit backstop) is harmless
+        logger.removeHandler(queue_handler)
+        handler.close()
+
+    lines = log_path.read_text(encoding="utf-8").splitlines()
+    assert lines == [f"record {i}" for i in range(5000)]
+
+
+# =============================================================================
+# Results CSV
+# =============================================================================
+
+
+def test_save_results_rows_match_csv_writer(tmp_path, monkeypatch):
+    """Hand-formatted behavioural rows are byte-identical to csv.writer's."""
+    monkeypatch.setattr(induction, "_init_paths", lambda: str(tmp_path))
+    participant_id = 'P,01 "pilot"\nretest'
+    data = {
+        "Correct Responses": 41,
+        "Accuracy": 0.8541666666666666,
+        "Average Reaction Time": None,
+        "Overall D-Prime": 1.25,
+        "Pre-Distractor Avg RT": 0.512,
+    }
+    result = {
+        "Participant ID": participant_id,
+        "Task": "Sequential",
+        "Block": 2,
+        "N-back Level": 3,
+        "Results": data,
+    }
+
+    path = induction.save_results_to_csv(
+        "results.csv", [result], participant_id=participant_id
+    )
+
+    measures = [
+        "Correct Responses",
+        "Incorrect Responses",
+        "Lapses",
+        "Accuracy",
+        "Total Reaction Time",
+        "Average Reaction Time",
+        "Overall D-Prime",
+        "Criterion",
+        "Hit Rate",
+        "FA Rate",
+        "Hits",
+        "Misses",
+        "False Alarms",
+        "Correct Rejections",
+    ] + [
+        f"{prefix}-Distractor {k}"
+        for prefix in ("Pre", "Post")
+        for k in ("Accuracy", "Avg RT", "A-Prime")
+    ]
+    expected = io.StringIO()
+    writer = csv.writer(expected)
+    writer.writerow(
+        [
+            "Seed Used",
+            induction.GLOBAL_SEED if induction.GLOBAL_SEED is not None else "random",
+        ]
+    )
+    writer.writerow(
+        ["Participant ID", "Task", "Block", "N-back Level", "Measure", "Value"]
+    )
+    for measure in measures:
+        writer.writerow(
+            [participant_id, "Sequential", 2, 3, measure, data.get(measure, "N/A")]
+        )
+
+    with open(path, newline="") as f:
+        assert f.read() == expected.getvalue()
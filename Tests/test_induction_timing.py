@@ -0,0 +1,252 @@
+"""
+Tests/test_induction_timing.py
+
+Regression tests for the induction's frame-locked screen timing and distractor
+scheduling.
+"""
+
+import importlib
+import math
+import os
+import sys
+from collections import Counter
+from contextlib import ExitStack
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from wand_nback import common as wand_common
+
+
+def _import_induction():
+    """
+    Import full_induction under the PsychoPy mock.
+
+    The module builds its window and stimuli on import. conftest installs the
+    MagicMock class itself as ``visual.TextStim`` etc., which would take the
+    window as a spec, so mock instances stand in while the import runs.
+    """
+    psychopy = sys.modules["psychopy"]
+    if not isinstance(getattr(psychopy, "__version__", None), str):
+        psychopy.__version__ = "2023.1.0"
+    visual_modules = {
+        id(m): m
+        for m in (sys.modules["psychopy.visual"], psychopy.visual, wand_common.visual)
+    }
+    window = MagicMock(size=(1650, 1000))
+    with ExitStack() as stack:
+        for module in visual_modules.values():
+            stack.enter_context(
+                patch.object(module, "Window", MagicMock(return_value=window))
+            )
+            for name in ("TextStim", "ImageStim", "Rect"):
+                stack.enter_context(patch.object(module, name, MagicMock()))
+        return importlib.import_module("wand_nback.full_induction")
+
+
+induction = _import_induction()
+
+
+class _Display:
+    """
+    Virtual-time display: each flip blocks until the next screen refresh.
+
+    ``sleep_overrun`` is added to any wait that sleeps rather than spins, as an
+    OS timer tick would (~15 ms on Windows).
+    """
+
+    def __init__(self, frame_rate, sleep_overrun=0.0):
+        self.frame_rate = frame_rate
+        self.sleep_overrun = sleep_overrun
+        self.now = 0.0
+
+    def refresh_index(self):
+        return round(self.now * self.frame_rate)
+
+    def flip(self, *args, **kwargs):
+        next_refresh = math.floor(self.now * self.frame_rate + 1e-9) + 1
+        self.now = next_refresh / self.frame_rate
+        return self.now
+
+    def wait(self, seconds, hogCPUperiod=0.2):
+        self.now += seconds
+        if seconds > hogCPUperiod:
+            self.now += self.sleep_overrun
+
+    def clock(self):
+        display = self
+
+        class _Clock:
+            def __init__(self):
+                self.start = display.now
+
+            def getTime(self):
+                return display.now - self.start
+
+        return _Clock()
+
+    def get_keys(self, *args, **kwargs):
+        # Reading the keyboard takes a little time but never sees a key
+        self.now += 0.0005
+        return []
+
+
+def _frames_on_screen(
+    monkeypatch, seconds, frame_rate, flip_each_frame, sleep_overrun=0.0
+):
+    """Refreshes between a screen's onset flip and the next screen's flip."""
+    display = _Display(frame_rate, sleep_overrun)
+    monkeypatch.setattr(wand_common.core, "Clock", display.clock)
+    monkeypatch.setattr(wand_common.core, "wait", display.wait)
+    monkeypatch.setattr(wand_common.event, "getKeys", display.get_keys)
+
+    win = type("Win", (), {"flip": staticmethod(display.flip)})()
+    onset = display.refresh_index()
+    wand_common.collect_trial_response(
+        win,
+        duration=induction.frame_locked_duration(
+            seconds, frame_rate, flip_each_frame=flip_each_frame
+        ),
+        response_map={"z": True, "m": False},
+        stop_on_response=False,
+        draw_callback=(lambda: None) if flip_each_frame else None,
+    )
+    display.flip()
+    return display.refresh_index() - onset
+
+
+@pytest.mark.parametrize("flip_each_frame", [False, True])
+@pytest.mark.parametrize("frame_rate", [60, 144])
+@pytest.mark.parametrize("seconds", [0.8, 0.9, 1.0, 1.1])
+def test_frame_locked_duration_lasts_whole_frames(
+    monkeypatch, seconds, frame_rate, flip_each_frame
+):
+    """Both wait loops hold the screen for the refresh count nearest the target."""
+    frames = _frames_on_screen(monkeypatch, seconds, frame_rate, flip_each_frame)
+
+    assert frames == round(seconds * frame_rate)
+
+
+@pytest.mark.parametrize("frame_rate", [60, 144])
+@pytest.mark.parametrize("seconds", [0.8, 0.9, 1.0, 1.1])
+def test_frame_locked_duration_survives_sleep_overrun(monkeypatch, seconds, frame_rate):
+    """A sleep that overruns by a Windows timer tick still ends on the right refresh."""
+    frames = _frames_on_screen(
+        monkeypatch, seconds, frame_rate, flip_each_frame=False, sleep_overrun=0.0156
+    )
+
+    assert frames == round(seconds * frame_rate)
+
+
+def test_frame_locked_duration_never_negative():
+    """A one-frame screen in the per-frame loop gets no redraws, not a negative wait."""
+    assert induction.frame_locked_duration(0.01, 60, flip_each_frame=True) == 0.0
+    assert induction.frame_locked_duration(0.01, 60) == pytest.approx(0.5 / 60)
+
+
+class _FlipWin:
+    """Window on a virtual display that runs ``callOnFlip`` calls at the flip."""
+
+    def __init__(self, display):
+        self.display = display
+        self._on_flip = []
+
+    def callOnFlip(self, func, *args):
+        self._on_flip.append((func, args))
+
+    def flip(self, *args, **kwargs):
+        self.display.flip()
+        queued, self._on_flip = self._on_flip, []
+        for func, args in queued:
+            func(*args)
+
+
+@pytest.mark.parametrize("frame_rate", [60, 144])
+@pytest.mark.parametrize("isi", [0.8, 1.0, 1.3])
+def test_distractor_triggers_fire_on_scheduled_refresh(monkeypatch, isi, frame_rate):
+    """The flash starts ``isi/2 - 0.1`` s and ends 200 ms after the ISI onset flip."""
+    display = _Display(frame_rate)
+    monkeypatch.setattr(wand_common.core, "Clock", display.clock)
+    monkeypatch.setattr(wand_common.core, "wait", display.wait)
+    monkeypatch.setattr(wand_common.event, "getKeys", display.get_keys)
+    win = _FlipWin(display)
+    fired = {}
+    monkeypatch.setattr(
+        induction,
+        "send_trigger",
+        lambda name: fired.setdefault(name, display.refresh_index()),
+    )
+
+    win.flip()  # ISI onset
+    isi_onset = display.refresh_index()
+    wand_common.collect_trial_response(
+        win,
+        duration=induction.frame_locked_duration(isi, frame_rate, flip_each_frame=True),
+        response_map={"z": True, "m": False},
+        draw_callback=induction.make_distractor_isi_frame(
+            win, (), MagicMock(), isi, frame_rate, trial_number=1
+        ),
+    )
+
+    onset = round((isi / 2 - 0.1) * frame_rate)
+    assert fired["distractor_onset"] - isi_onset == onset
+    assert fired["distractor_offset"] - isi_onset == onset + round(0.2 * frame_rate)
+
+
+# =============================================================================
+# Distractor placement
+# =============================================================================
+
+
+@pytest.mark.parametrize(
+    "earliest, latest, count, min_gap",
+    [(6, 160, 13, 6), (3, 40, 5, 4), (1, 20, 20, 1), (10, 10, 1, 5)],
+)
+def test_distractor_trials_within_range_and_spaced(
+    monkeypatch, earliest, latest, count, min_gap
+):
+    """Every draw stays in range, is sorted, and honours the minimum gap."""
+    monkeypatch.setattr(induction, "RNG", np.random.default_rng(20260417))
+
+    for _ in range(200):
+        trials = induction.sample_distractor_trials(earliest, latest, count, min_gap)
+
+        assert len(trials) == count
+        assert all(earliest <= t <= latest for t in trials)
+        assert all(gap >= min_gap for gap in np.diff(trials))
+
+
+def test_distractor_trials_capped_when_range_too_small(monkeypatch):
+    """A range that cannot hold ``count`` at ``min_gap`` returns as many as fit."""
+    monkeypatch.setattr(induction, "RNG", np.random.default_rng(7))
+
+    # 1..10 holds at most three trials four apart (e.g. 1, 5, 9)
+    trials = induction.sample_distractor_trials(1, 10, 5, 4)
+
+    assert len(trials) == 3
+    assert all(1 <= t <= 10 for t in trials)
+    assert all(gap >= 4 for gap in np.diff(trials))
+
+
+@pytest.mark.parametrize("earliest, latest", [(10, 9), (10, 3)])
+def test_distractor_trials_empty_range(earliest, latest):
+    """An empty trial range yields no distractors."""
+    assert induction.sample_distractor_trials(earliest, latest, 3, 2) == []
+
+
+def test_distractor_trials_uniform_over_valid_placements(monkeypatch):
+    """Each spacing-valid placement is drawn about equally often."""
+    monkeypatch.setattr(induction, "RNG", np.random.default_rng(11))
+    valid = [(a, b) for a in range(1, 7) for b in range(a + 3, 7)]
+
+    draws = 6000
+    counts = Counter(
+        tuple(induction.sample_distractor_trials(1, 6, 2, 3)) for _ in range(draws)
+    )
+
+    assert set(counts) == set(valid)
+    expected = draws / len(valid)
+    assert all(abs(c - expected) < 0.15 * expected for c in counts.values())
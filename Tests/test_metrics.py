@@ -1,5 +1,6 @@
 import json
 import os
+import random
 import sys
 from math import isclose
 
@@ -9,9 +10,13 @@ import pytest
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from wand_nback.analysis import (
+    Resp,
+    as_trial_array,
+    as_trial_records,
     calculate_A_prime,
     calculate_accuracy_and_rt,
     calculate_dprime,
+    calculate_dprime_batch,
     calculate_sdt_metrics,
     summarise_sequential_block,
 )
@@ -639,3 +644,142 @@ def test_accuracy_zero_correct():
     assert acc == 0.0
     assert corr == 0
     assert incorr == 2
+
+
+def test_dprime_batch_matches_single_block(perfect_data, random_data):
+    """Batch d' must equal per-block d' (including the undefined-block case)."""
+    blocks = [perfect_data, random_data, perfect_data[:1]]
+    counts = [calculate_sdt_metrics(b) for b in blocks]
+
+    batch = calculate_dprime_batch(
+        [c["hits"] for c in counts],
+        [c["hits"] + c["misses"] for c in counts],
+        [c["false_alarms"] for c in counts],
+        [c["false_alarms"] + c["correct_rejections"] for c in counts],
+    )
+    expected = [calculate_dprime(b) for b in blocks]
+
+    log_evidence(
+        "D-Prime (Batch)",
+        "Perfect, random and single-trial blocks",
+        f"{[round(e, 3) for e in expected]}",
+        f"{[round(float(d), 3) for d in batch]}",
+        "PASS" if all(isclose(d, e) for d, e in zip(batch, expected)) else "FAIL",
+    )
+
+    assert len(batch) == len(blocks)
+    for d, e in zip(batch, expected):
+        assert isclose(d, e, abs_tol=1e-12)
+
+
+def test_response_labels_map_to_codes(random_data):
+    """Trial dicts are converted to Resp codes and the labels round-trip."""
+    trials = random_data + [
+        {
+            "Trial": 5,
+            "Is Target": True,
+            "Response": "lapse",
+            "Reaction Time": None,
+            "Accuracy": False,
+        }
+    ]
+    arr = as_trial_array(trials)
+    labels = [Resp(code).label for code in arr["Response"]]
+
+    log_evidence(
+        "Response Codes",
+        "Random data plus one lapse",
+        f"{[t['Response'] for t in trials]}",
+        f"{labels}",
+        "PASS" if labels == [t["Response"] for t in trials] else "FAIL",
+    )
+
+    assert labels == [t["Response"] for t in trials]
+    assert arr["Response"][-1] == Resp.LAPSE
+    assert calculate_accuracy_and_rt(arr)[2] == 1
+
+
+def test_trial_records_round_trip(random_data):
+    """Trial dicts survive conversion to a trial array and back."""
+    trials = random_data + [
+        {
+            "Trial": 5,
+            "Image": "",
+            "Is Target": True,
+            "Response": "lapse",
+            "Reaction Time": None,
+            "Accuracy": False,
+        }
+    ]
+    records = as_trial_records(as_trial_array(trials))
+    expected = [{"Trial": i + 1, "Image": "", **t} for i, t in enumerate(trials)]
+
+    log_evidence(
+        "Trial Records",
+        "Random data plus one lapse",
+        f"{len(expected)} records",
+        f"{len(records)} records",
+        "PASS" if records == expected else "FAIL",
+    )
+
+    assert records == expected
+
+
+def test_trial_array_keeps_long_image_names():
+    """Image names longer than the default column width are not truncated."""
+    name = "custom_stimulus_" + "x" * 80 + ".png"
+    trials = [
+        {
+            "Trial": 1,
+            "Image": name,
+            "Is Target": False,
+            "Response": "non-match",
+            "Reaction Time": 0.5,
+            "Accuracy": True,
+        }
+    ]
+    records = as_trial_records(as_trial_array(trials))
+
+    log_evidence(
+        "Long Image Names",
+        f"{len(name)}-character image name",
+        name,
+        records[0]["Image"],
+        "PASS" if records[0]["Image"] == name else "FAIL",
+    )
+
+    assert records[0]["Image"] == name
+
+
+def test_sdt_counts_match_trial_by_trial_tally():
+    """The vectorised SDT counts agree with a plain per-trial tally."""
+    rng = random.Random(14)
+    trials = [
+        {
+            "Trial": i + 1,
+            "Is Target": rng.random() < 0.4,
+            "Response": rng.choice(["match", "non-match", "lapse"]),
+        }
+        for i in range(500)
+    ]
+
+    expected = {"hits": 0, "misses": 0, "false_alarms": 0, "correct_rejections": 0}
+    for t in trials:
+        said_match = t["Response"] == "match"
+        if t["Is Target"]:
+            expected["hits" if said_match else "misses"] += 1
+        else:
+            expected["false_alarms" if said_match else "correct_rejections"] += 1
+
+    metrics = calculate_sdt_metrics(as_trial_array(trials))
+    actual = {key: metrics[key] for key in expected}
+
+    log_evidence(
+        "SDT Counts",
+        "500 seeded random trials with lapses",
+        f"{expected}",
+        f"{actual}",
+        "PASS" if actual == expected else "FAIL",
+    )
+
+    assert actual == expected
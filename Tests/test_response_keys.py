@@ -147,3 +147,26 @@ def test_collect_trial_response_returns_labels_for_seeded_custom_keys(monkeypatc
 
     assert match_response == "match"
     assert non_match_response == "non-match"
+
+
+def test_check_response_keys_uses_key_event_time():
+    clock = _FakeClock()
+    response_map = {"z": True, "m": False}
+
+    resp, rt, special = wand_common.check_response_keys(
+        [["m", 0.25]], clock, True, response_map
+    )
+    assert (resp, rt, special) == (False, 0.25, False)
+
+    resp, rt, _ = wand_common.check_response_keys(["z"], clock, True, response_map)
+    assert resp is True
+    assert rt == 0.0
+
+
+def test_check_response_keys_clamps_pre_onset_stamp():
+    """A key buffered from before the trial clock started is timed at 0, not negative."""
+    resp, rt, special = wand_common.check_response_keys(
+        [["z", -0.03]], _FakeClock(), True, {"z": True, "m": False}
+    )
+
+    assert (resp, rt, special) == (True, 0.0, False)
@@ -0,0 +1,68 @@
+"""
+Tests/test_sequence_generation.py
+
+Regression tests for the n-back sequence generators' target placement.
+"""
+
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from wand_nback import common as wand_common
+
+IMAGE_FILES = [f"image_{i}.png" for i in range(24)]
+
+
+@pytest.fixture
+def sampled_targets(monkeypatch):
+    """Record the target indices each generator passes to `_nback_sources`."""
+    recorded = []
+    nback_sources = wand_common._nback_sources
+
+    def spy(target_idxs, n, length):
+        recorded.append(target_idxs.tolist())
+        return nback_sources(target_idxs, n, length)
+
+    monkeypatch.setattr(wand_common, "_nback_sources", spy)
+    monkeypatch.setattr(wand_common, "print_debug_info", lambda *a, **k: None)
+    return recorded
+
+
+def _has_chain(targets, n):
+    """True if some target sits n trials after another target."""
+    target_set = set(targets)
+    return any(t - n in target_set for t in targets)
+
+
+@pytest.mark.parametrize("n", [2, 3, 4])
+@pytest.mark.parametrize("seed", range(5))
+def test_dual_sequence_targets_are_true_repeats(sampled_targets, seed, n):
+    """Every sampled dual target repeats both position and image n trials back."""
+    random.seed(seed)
+    pos_seq, image_seq = wand_common.generate_dual_nback_sequence(
+        60, 3, n, IMAGE_FILES, target_rate=0.9
+    )
+    (targets,) = sampled_targets
+
+    assert _has_chain(targets, n)
+    for t in targets:
+        assert pos_seq[t] == pos_seq[t - n]
+        assert image_seq[t] == image_seq[t - n]
+
+
+@pytest.mark.parametrize("n", [2, 3, 4])
+@pytest.mark.parametrize("seed", range(5))
+def test_position_sequence_targets_are_true_repeats(sampled_targets, seed, n):
+    """Every sampled spatial target repeats the position n trials back."""
+    random.seed(seed)
+    seq = wand_common.generate_positions_with_matches(60, n, target_percentage=0.9)
+    (targets,) = sampled_targets
+
+    assert _has_chain(targets, n)
+    assert all(0 <= p < 12 for p in seq)
+    for t in targets:
+        assert seq[t] == seq[t - n]
@@ -16,12 +16,147 @@ License
 MIT (see LICENSE).
 """
 
-from typing import Any, Dict, List, Optional, Tuple
+from enum import IntEnum
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
+import numpy as np
 from scipy.stats import norm
 
+# Bound once: the inverse normal CDF used for every d′ / criterion
+_PPF = norm.ppf
 
-def calculate_A_prime(trials: List[Dict[str, Any]]) -> Optional[float]:
+
+class Resp(IntEnum):
+    """Response codes stored in the ``Response`` column of a trial array."""
+
+    NONE = 0
+    MATCH = 1
+    NOMATCH = 2
+    LAPSE = 3
+
+    @classmethod
+    def from_label(cls, label: Optional[str]) -> "Resp":
+        """Return the code for a response label ("match", "non-match", "lapse")."""
+        return _RESP_BY_LABEL.get(label, cls.NONE)
+
+    @property
+    def label(self) -> str:
+        """The string written to data files for this code."""
+        return _RESP_LABELS[self]
+
+
+_RESP_LABELS = {
+    Resp.NONE: "",
+    Resp.MATCH: "match",
+    Resp.NOMATCH: "non-match",
+    Resp.LAPSE: "lapse",
+}
+_RESP_BY_LABEL = {label: code for code, label in _RESP_LABELS.items()}
+
+
+def trial_dtype(image_len: int = 64) -> np.dtype:
+    """
+    Return the column layout of a Sequential N-back trial log.
+
+    One row per scored trial. Responses are ``Resp`` codes; lapses are stored
+    as ``Resp.LAPSE`` with a NaN reaction time. The ``Image`` column holds
+    ``image_len`` characters, so size it from the longest image name in the
+    block: NumPy silently truncates longer strings.
+    """
+    return np.dtype(
+        [
+            ("Trial", "i4"),
+            ("Image", f"U{max(image_len, 1)}"),
+            ("Is Target", "?"),
+            ("Response", "i1"),
+            ("Reaction Time", "f8"),
+            ("Accuracy", "?"),
+        ]
+    )
+
+
+# Default layout, wide enough for the bundled stimulus names
+TRIAL_DTYPE = trial_dtype()
+
+TrialData = Union[Sequence[Dict[str, Any]], np.ndarray]
+
+
+def as_trial_array(trials: TrialData) -> np.ndarray:
+    """
+    Return trial-level data as a `trial_dtype` structured array.
+
+    Structured arrays are returned unchanged. Lists of trial dicts (the format
+    used by the practice script and older data) are converted one column at a
+    time, with response labels mapped to ``Resp`` codes and a missing reaction
+    time stored as NaN.
+    """
+    if isinstance(trials, np.ndarray):
+        return trials
+
+    n = len(trials)
+    images = [t.get("Image") or "" for t in trials]
+    arr = np.empty(n, dtype=trial_dtype(max(map(len, images), default=0)))
+    arr["Trial"] = np.fromiter(
+        (t.get("Trial", idx + 1) for idx, t in enumerate(trials)), "i4", n
+    )
+    arr["Image"] = images
+    arr["Is Target"] = np.fromiter(
+        (bool(t.get("Is Target", False)) for t in trials), bool, n
+    )
+    arr["Response"] = np.fromiter(
+        (Resp.from_label(t.get("Response")) for t in trials), "i1", n
+    )
+    arr["Reaction Time"] = np.fromiter(
+        (
+            np.nan if t.get("Reaction Time") is None else t["Reaction Time"]
+            for t in trials
+        ),
+        "f8",
+        n,
+    )
+    arr["Accuracy"] = np.fromiter(
+        (bool(t.get("Accuracy", False)) for t in trials), bool, n
+    )
+    return arr
+
+
+def as_trial_records(trials: TrialData) -> List[Dict[str, Any]]:
+    """
+    Return trial-level data as a list of trial dicts.
+
+    The inverse of `as_trial_array`, for callers that still expect one dict
+    per trial: response codes become their labels and a NaN reaction time
+    becomes None.
+    """
+    trials = as_trial_array(trials)
+    names = trials.dtype.names
+    records = []
+    for row in trials.tolist():
+        record = dict(zip(names, row))
+        rt = record["Reaction Time"]
+        if rt != rt:
+            record["Reaction Time"] = None
+        record["Response"] = _RESP_LABELS[record["Response"]]
+        records.append(record)
+    return records
+
+
+def _sdt_counts(trials: np.ndarray) -> Tuple[int, int, int, int]:
+    """
+    Internal helper: (hits, misses, false_alarms, correct_rejections).
+
+    Lapses count as "non-match" responses, i.e. misses on targets and correct
+    rejections on non-targets.
+    """
+    # Cell index 2 * is_target + said_match, tallied in one bincount:
+    # 0 correct rejection, 1 false alarm, 2 miss, 3 hit
+    cells = trials["Is Target"].astype(np.intp) * 2
+    cells += trials["Response"] == Resp.MATCH
+    correct_rejections, false_alarms, misses, hits = np.bincount(cells, minlength=4)
+    return int(hits), int(misses), int(false_alarms), int(correct_rejections)
+
+
+def calculate_A_prime(trials: TrialData) -> Optional[float]:
     """
     Compute the A′ (A-prime) nonparametric sensitivity index for a set of trials.
 
@@ -29,27 +164,10 @@ def calculate_A_prime(trials: List[Dict[str, Any]]) -> Optional[float]:
       - "Is Target": bool
       - "Response": str in {"match", "non-match", "lapse"}.
     """
-    if not trials:
+    if len(trials) == 0:
         return None
 
-    hits = 0
-    false_alarms = 0
-    misses = 0
-    correct_rejections = 0
-
-    for t in trials:
-        is_target = t.get("Is Target", False)
-        response = t.get("Response")
-        said_match = response == "match"
-
-        if is_target and said_match:
-            hits += 1
-        elif is_target and not said_match:
-            misses += 1
-        elif (not is_target) and said_match:
-            false_alarms += 1
-        elif (not is_target) and (not said_match):
-            correct_rejections += 1
+    hits, misses, false_alarms, correct_rejections = _sdt_counts(as_trial_array(trials))
 
     total_targets = hits + misses
     total_non_targets = false_alarms + correct_rejections
@@ -77,7 +195,7 @@ def calculate_A_prime(trials: List[Dict[str, Any]]) -> Optional[float]:
 
 
 def calculate_accuracy_and_rt(
-    trials: List[Dict[str, Any]],
+    trials: TrialData,
 ) -> Tuple[int, int, int, float, float, float]:
     """
     Compute accuracy (%), total RT, and average RT, plus counts.
@@ -86,30 +204,34 @@ def calculate_accuracy_and_rt(
       correct_responses, incorrect_responses, lapses,
       total_reaction_time, avg_rt, accuracy (%).
     """
-    if not trials:
+    if len(trials) == 0:
         return 0, 0, 0, 0.0, 0.0, 0.0
 
+    trials = as_trial_array(trials)
     total_trials = len(trials)
 
-    correct = sum(1 for t in trials if t.get("Accuracy"))
-    lapses = sum(1 for t in trials if t.get("Response") == "lapse")
+    correct = int(np.count_nonzero(trials["Accuracy"]))
+    lapses = int(np.count_nonzero(trials["Response"] == Resp.LAPSE))
     incorrect = total_trials - correct - lapses
 
     total_responded = correct + incorrect + lapses
     accuracy = (correct / total_responded) * 100 if total_responded else 0.0
 
-    rts = [t["Reaction Time"] for t in trials if t.get("Reaction Time") is not None]
-    total_rt = sum(rts)
-    avg_rt = total_rt / len(rts) if rts else 0.0
+    rts = trials["Reaction Time"]
+    rts = rts[~np.isnan(rts)]
+    total_rt = float(rts.sum())
+    avg_rt = total_rt / len(rts) if len(rts) else 0.0
 
     return correct, incorrect, lapses, total_rt, avg_rt, accuracy
 
 
-def calculate_dprime(detailed_data: List[Dict[str, Any]]) -> float:
+def calculate_dprime(detailed_data: TrialData) -> float:
     """
     Compute d′ (d-prime) with log-linear correction.
 
     For full SDT metrics including criterion, use calculate_sdt_metrics().
+    Block summaries from summarise_sequential_block already carry the value as
+    "Overall D-Prime"; read it from there rather than rescanning the trials.
 
     Trials must contain:
       - "Is Target": bool
@@ -119,7 +241,7 @@ def calculate_dprime(detailed_data: List[Dict[str, Any]]) -> float:
     return metrics["d_prime"]
 
 
-def calculate_sdt_metrics(detailed_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+def calculate_sdt_metrics(detailed_data: TrialData) -> Dict[str, Any]:
     """
     Compute all Signal Detection Theory metrics with log-linear correction.
 
@@ -144,27 +266,12 @@ def calculate_sdt_metrics(detailed_data: List[Dict[str, Any]]) -> Dict[str, Any]
         "criterion": 0.0,
     }
 
-    if not detailed_data:
+    if len(detailed_data) == 0:
         return result
 
-    hits = 0
-    false_alarms = 0
-    misses = 0
-    correct_rejections = 0
-
-    for t in detailed_data:
-        is_target = t.get("Is Target", False)
-        response = t.get("Response")
-        said_match = response == "match"
-
-        if is_target and said_match:
-            hits += 1
-        elif is_target and not said_match:
-            misses += 1
-        elif (not is_target) and said_match:
-            false_alarms += 1
-        elif (not is_target) and (not said_match):
-            correct_rejections += 1
+    hits, misses, false_alarms, correct_rejections = _sdt_counts(
+        as_trial_array(detailed_data)
+    )
 
     total_targets = hits + misses
     total_non_targets = false_alarms + correct_rejections
@@ -185,8 +292,7 @@ def calculate_sdt_metrics(detailed_data: List[Dict[str, Any]]) -> Dict[str, Any]
     result["fa_rate"] = fa_rate
 
     try:
-        z_hit = norm.ppf(hit_rate)
-        z_fa = norm.ppf(fa_rate)
+        z_hit, z_fa = _PPF([hit_rate, fa_rate])
         d_prime = z_hit - z_fa
         criterion = -0.5 * (z_hit + z_fa)
         result["d_prime"] = d_prime
@@ -197,15 +303,51 @@ def calculate_sdt_metrics(detailed_data: List[Dict[str, Any]]) -> Dict[str, Any]
     return result
 
 
+def calculate_dprime_batch(
+    hits: Sequence[int],
+    total_targets: Sequence[int],
+    false_alarms: Sequence[int],
+    total_non_targets: Sequence[int],
+) -> np.ndarray:
+    """
+    Compute d′ for many blocks at once from their SDT counts.
+
+    Uses the same log-linear correction as `calculate_sdt_metrics`, with a
+    single inverse-normal call for all blocks. Blocks with no targets or no
+    non-targets get a d′ of 0.0, as in the single-block version.
+
+    Parameters
+    ----------
+    hits, total_targets, false_alarms, total_non_targets : Sequence[int]
+        Per-block counts, all the same length.
+
+    Returns
+    -------
+    numpy.ndarray
+        One d′ value per block (float64).
+    """
+    hits = np.asarray(hits, dtype=float)
+    total_targets = np.asarray(total_targets, dtype=float)
+    false_alarms = np.asarray(false_alarms, dtype=float)
+    total_non_targets = np.asarray(total_non_targets, dtype=float)
+
+    hit_rate = (hits + 0.5) / (total_targets + 1)
+    fa_rate = (false_alarms + 0.5) / (total_non_targets + 1)
+    d_prime = _PPF(hit_rate) - _PPF(fa_rate)
+
+    valid = (total_targets > 0) & (total_non_targets > 0)
+    return np.where(valid, d_prime, 0.0)
+
+
 def _window_metrics(
-    trials: List[Dict[str, Any]],
+    trials: np.ndarray,
 ) -> Tuple[Optional[float], Optional[float], Optional[float]]:
     """
     Internal helper: accuracy, avg RT, A′ for a subset of trials.
 
     Returns (accuracy_percent, avg_rt, a_prime) or (None, None, None) if no trials.
     """
-    if not trials:
+    if len(trials) == 0:
         return None, None, None
 
     _, _, _, _, avg_rt, accuracy = calculate_accuracy_and_rt(trials)
@@ -213,8 +355,31 @@ def _window_metrics(
     return accuracy, avg_rt, a_prime
 
 
+def _distractor_window_masks(
+    trial_numbers: np.ndarray,
+    distractor_trials: Sequence[int],
+    total_trials: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Internal helper: row masks for the 3 trials before / after each distractor.
+
+    Windows are marked by slicing a flag table indexed by trial number, then
+    every row is classified with one lookup. Only trial numbers in
+    ``1..total_trials`` can fall inside a window.
+    """
+    pre_flags = np.zeros(total_trials + 1, dtype=bool)
+    post_flags = np.zeros(total_trials + 1, dtype=bool)
+    for d in distractor_trials:
+        pre_flags[max(d - 3, 1) : max(d, 1)] = True
+        post_flags[max(d + 1, 1) : max(d + 4, 1)] = True
+
+    in_range = (trial_numbers >= 1) & (trial_numbers <= total_trials)
+    lookup = np.where(in_range, trial_numbers, 0)
+    return pre_flags[lookup] & in_range, post_flags[lookup] & in_range
+
+
 def summarise_sequential_block(
-    detailed_data: List[Dict[str, Any]],
+    detailed_data: TrialData,
     distractor_trials: List[int],
     block_number: int,
 ) -> Dict[str, Any]:
@@ -226,8 +391,12 @@ def summarise_sequential_block(
       - global accuracy, total RT, average RT
       - pre/post distractor accuracy, RT, A′
       - overall d′
+
+    ``detailed_data`` may be a `trial_dtype` structured array (as written by
+    the induction script) or a list of trial dicts.
     """
-    total_trials = len(detailed_data)
+    trials = as_trial_array(detailed_data)
+    total_trials = len(trials)
 
     # Overall counts and RT
     (
@@ -237,35 +406,24 @@ def summarise_sequential_block(
         total_rt,
         avg_rt,
         accuracy,
-    ) = calculate_accuracy_and_rt(detailed_data)
+    ) = calculate_accuracy_and_rt(trials)
 
     # Pre / post distractor windows
-    pre_indices: set[int] = set()
-    post_indices: set[int] = set()
-
-    for d in distractor_trials:
-        # 3 trials before the distractor
-        for j in range(d - 3, d):
-            if 1 <= j <= total_trials:
-                pre_indices.add(j)
-        # 3 trials after the distractor
-        for j in range(d + 1, d + 4):
-            if 1 <= j <= total_trials:
-                post_indices.add(j)
-
-    pre_data = [t for t in detailed_data if t["Trial"] in pre_indices]
-    post_data = [t for t in detailed_data if t["Trial"] in post_indices]
+    pre_mask, post_mask = _distractor_window_masks(
+        trials["Trial"], distractor_trials, total_trials
+    )
+    pre_data = trials[pre_mask]
+    post_data = trials[post_mask]
 
     pre_acc, pre_rt, pre_ap = _window_metrics(pre_data)
     post_acc, post_rt, post_ap = _window_metrics(post_data)
 
     # This matches your original "reaction_times" list
-    reaction_times = [
-        t["Reaction Time"] for t in detailed_data if t.get("Reaction Time") is not None
-    ]
+    rts = trials["Reaction Time"]
+    reaction_times = rts[~np.isnan(rts)].tolist()
 
     # Get full SDT metrics (d', criterion, hits, FA, etc.)
-    sdt = calculate_sdt_metrics(detailed_data)
+    sdt = calculate_sdt_metrics(trials)
 
     return {
         "Block Number": block_number,
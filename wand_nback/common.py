@@ -21,14 +21,31 @@ MIT (see LICENSE).
 
 from __future__ import annotations
 
+import gc
 import inspect
 import json
 import logging
+import math
 import os
 import random
 import sys
-from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
-
+from collections import deque
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import numpy as np
 from psychopy import core, event, visual
 
 # =============================================================================
@@ -53,10 +70,16 @@ DEFAULT_CONFIG_DIR = os.path.join(BASE_DIR, "config")
 PARAMS: Dict[str, Any] = {}
 TEXT: Dict[str, str] = {}
 
-# Cached background grid lines
+# Cached background grid lines, and an optional snapshot of them (bake_grid)
 _GRID_LINES: List[visual.ShapeStim] = []
+_GRID_IMAGE: Optional[visual.BufferImageStim] = None
 _RESERVED_RESPONSE_KEYS = {"escape", "space", "return", "5"}
 
+# Undrawn response loops stop sleeping this long before their deadline and
+# spin instead: a 1 ms sleep can overrun by a whole timer tick (~15 ms on
+# Windows), about two frames at 60 Hz once added to the poll itself.
+_SPIN_BEFORE_DEADLINE = 0.035
+
 
 def _safe_read_json(path: str) -> Any:
     """
@@ -429,10 +452,28 @@ def get_text(key: str, **fmt: Any) -> str:
     Returns
     -------
     str
-        The resolved string. If the key is missing the key itself is returned."""
+        The resolved string. If the key is missing the key itself is returned.
+
+    Notes
+    -----
+    Formatted results are memoised on the template and substitutions, so
+    repeated screens skip `str.format`. Each value's type is part of the key,
+    so equal values of different types (``1``, ``1.0``, ``True``) are formatted
+    separately. Unhashable substitutions bypass the cache."""
     raw = TEXT.get(key, key)
+    items = tuple(sorted((name, type(value), value) for name, value in fmt.items()))
     try:
-        return raw.format(**fmt)
+        hash(items)
+    except TypeError:
+        return _format_text.__wrapped__(raw, items)
+    return _format_text(raw, items)
+
+
+@lru_cache(maxsize=256, typed=True)
+def _format_text(raw: str, items: Tuple[Tuple[str, type, Any], ...]) -> str:
+    """Apply keyword substitutions to a text template (memoised by `get_text`)."""
+    try:
+        return raw.format(**{name: value for name, _, value in items})
     except Exception:  # noqa: BLE001
         return raw
 
@@ -445,6 +486,9 @@ def install_error_hook(win: visual.Window) -> None:
       1. Writes the traceback to stderr.
       2. Displays a concise error notice in the PsychoPy window.
 
+    The notice stim is built here, while the window is known to be healthy,
+    so the hook itself never has to create GL objects.
+
     Parameters
     ----------
     win : psychopy.visual.Window
@@ -454,19 +498,19 @@ def install_error_hook(win: visual.Window) -> None:
     -------
     None
     """
+    error_stim = visual.TextStim(
+        win, text=get_text("error_generic"), color="white", height=24, wrapWidth=900
+    )
 
     def _hook(etype, value, tb):
         import traceback  # local import to avoid a global dependency
 
         traceback.print_exception(etype, value, tb)
         try:
-            msg = get_text("error_generic")
-            visual.TextStim(
-                win, text=msg, color="white", height=24, wrapWidth=900
-            ).draw()
+            error_stim.draw()
             win.flip()
-        except Exception:
-            pass
+        except Exception as e:
+            LOGGER.warning(f"Could not display the error notice: {e}")
 
     sys.excepthook = _hook
 
@@ -521,25 +565,21 @@ def prompt_text_input(
     if text_style:
         txt_kwargs.update(text_style)
 
-    buffer = initial_text
+    # The stims are built once; only the buffer text changes between frames
+    chars: List[str] = list(initial_text)
+    prompt_stim = visual.TextStim(win, text=prompt, pos=(0, 120), **txt_kwargs)
+    box = visual.Rect(
+        win, width=700, height=60, lineColor="white", fillColor=None, pos=(0, 40)
+    )
+    buffer_stim = visual.TextStim(
+        win, text=initial_text or " ", pos=(0, 40), **txt_kwargs
+    )
 
-    # TextStim for the prompt and buffer are created on each frame so changes show.
     while True:
-        # Draw the prompt
-        prompt_stim = visual.TextStim(win, text=prompt, pos=(0, 120), **txt_kwargs)
+        buffer_stim.text = "".join(chars) or " "
         prompt_stim.draw()
-
-        # Draw the input box (a rectangle) and current buffer text
-        box = visual.Rect(
-            win, width=700, height=60, lineColor="white", fillColor=None, pos=(0, 40)
-        )
         box.draw()
-
-        buffer_stim = visual.TextStim(
-            win, text=buffer if buffer else " ", pos=(0, 40), **txt_kwargs
-        )
         buffer_stim.draw()
-
         win.flip()
 
         keys = event.waitKeys()
@@ -549,15 +589,16 @@ def prompt_text_input(
 
         # Handle return
         if "return" in keys or "enter" in keys:
-            if buffer or allow_empty:
-                return buffer
+            if chars or allow_empty:
+                return "".join(chars)
             else:
                 # do not accept empty buffer unless allowed
                 continue
 
         # Handle backspace
         if "backspace" in keys:
-            buffer = buffer[:-1]
+            if chars:
+                chars.pop()
             continue
 
         # Handle escape as a non-submitting key - return nothing if you want else ignore
@@ -573,7 +614,7 @@ def prompt_text_input(
             if restrict_digits and not key.isdigit():
                 # ignore non-digit key when restricting digits
                 continue
-            buffer += key
+            chars.append(key)
             continue
 
         # Ignore any other keys by default and continue looping
@@ -697,6 +738,14 @@ def show_text_screen(
     if allow_escape_quit and "escape" not in wait_keys:
         wait_keys.append("escape")
 
+    # The screen is static: draw and flip it once, then only poll the
+    # keyboard, sleeping between polls instead of flipping every refresh
+    stim.draw()
+    if overlay_stimuli:
+        for s in overlay_stimuli:
+            s.draw()
+    win.flip()
+
     timer = core.Clock()
     event.clearEvents()
 
@@ -704,12 +753,6 @@ def show_text_screen(
         if duration > 0 and timer.getTime() >= duration:
             return None
 
-        stim.draw()
-        if overlay_stimuli:
-            for s in overlay_stimuli:
-                s.draw()
-        win.flip()
-
         pressed = event.getKeys(keyList=wait_keys) if wait_keys else []
         if pressed:
             key = pressed[0]
@@ -717,6 +760,8 @@ def show_text_screen(
                 core.quit()
             return key
 
+        core.wait(0.02, hogCPUperiod=0.0005)
+
 
 def check_response_keys(
     keys: Iterable[str],
@@ -734,9 +779,14 @@ def check_response_keys(
     Parameters
     ----------
     keys : list
-        List of keys returned by event.getKeys().
+        Keys returned by event.getKeys(): plain key names, or ``[name, time]``
+        pairs when called with ``timeStamped=timer``.
     timer : core.Clock
-        Clock used to timestamp the reaction time.
+        Clock used to timestamp the reaction time. A stamped key keeps the
+        time PsychoPy stamped on its key event (with the pyglet backend, when
+        the event was dispatched); a plain name is timed now. A stamp from
+        before the clock started (a key still buffered from the previous
+        screen) counts as 0.
     is_valid_trial : bool
         If False, valid response keys are ignored (but exit/special keys still work).
     response_map : dict
@@ -753,22 +803,29 @@ def check_response_keys(
     if not keys:
         return None, None, False
 
+    # PsychoPy drops a falsy time from a stamped pair, so a 1-item list can
+    # arrive; it is timed like a plain name
+    stamped = [
+        (k, None) if isinstance(k, str) else (k[0], k[1] if len(k) > 1 else None)
+        for k in keys
+    ]
+
     # 1. Handle Exit (Priority)
-    if any(k in exit_keys for k in keys):
+    if any(k in exit_keys for k, _ in stamped):
         core.quit()
 
     # 2. Handle Special Keys (e.g., '5' for skip)
     if special_keys:
-        for k in keys:
+        for k, _ in stamped:
             if k in special_keys:
                 special_keys[k]()
                 return None, None, True
 
     # 3. Handle Task Responses
     if is_valid_trial:
-        for k in keys:
+        for k, key_time in stamped:
             if k in response_map:
-                rt = timer.getTime()
+                rt = timer.getTime() if key_time is None else max(0.0, key_time)
                 return response_map[k], rt, False
 
     return None, None, False
@@ -805,7 +862,8 @@ def collect_trial_response(
     draw_callback : Callable[[], None], optional
         A function to call every frame to draw stimuli. If provided, win.flip()
         is called immediately after execution. If None, the function sleeps briefly
-        between key checks to save CPU.
+        between key checks to save CPU, then polls without sleeping for the
+        last few frames so it returns promptly at ``duration``.
     tick_callback : Callable[[float], None], optional
         A function called every frame with the current elapsed time (in seconds).
         Used for logic that triggers at specific times (e.g., distractors).
@@ -842,8 +900,13 @@ def collect_trial_response(
     response_val = None
     response_rt = None
 
-    while clock.getTime() < duration:
-        t = clock.getTime()
+    # Bound once: these are called on every pass of the polling loop
+    get_time = clock.getTime
+    get_keys = event.getKeys
+    flip = win.flip
+
+    while get_time() < duration:
+        t = get_time()
 
         # 1. Run periodic logic (e.g. flashing distractors)
         if tick_callback:
@@ -852,12 +915,15 @@ def collect_trial_response(
         # 2. Update screen (if provided)
         if draw_callback:
             draw_callback()
-            win.flip()
+            flip()
 
         # 3. Check keys using the existing helper
         # We only check for a response if we haven't already recorded one
         if response_val is None:
-            keys = event.getKeys(keyList=all_keys)
+            # Stamped against this trial's clock as PsychoPy dispatches each
+            # key event; under pyglet that is no earlier than reading the
+            # clock here, it just saves the extra read
+            keys = get_keys(keyList=all_keys, timeStamped=clock)
 
             resp, rt, special_triggered = check_response_keys(
                 keys,
@@ -885,23 +951,92 @@ def collect_trial_response(
                 if stop_on_response:
                     return response_val, response_rt
 
-        # Sleep briefly to save CPU if we aren't drawing every frame
-        if not draw_callback:
-            core.wait(0.001)
+                # Nothing left to draw, tick or read: block for the remainder
+                # of the trial instead of polling
+                if not draw_callback and not tick_callback:
+                    core.wait(max(0.0, duration - get_time()))
+                    return response_val, response_rt
+
+        # Nothing to draw: sleep between key checks while the deadline is far
+        # off (hogCPUperiod=0 makes this a real sleep). Near the deadline a
+        # sleep could overrun it, so the last stretch is polled without one
+        # and the loop ends within a key check of ``duration``.
+        if not draw_callback and duration - get_time() > _SPIN_BEFORE_DEADLINE:
+            core.wait(0.001, hogCPUperiod=0)
 
     return response_val, response_rt
 
 
+@contextmanager
+def gc_paused() -> Iterator[None]:
+    """
+    Suspend automatic garbage collection for a block of trials.
+
+    A cyclic-GC pass triggered by per-trial allocations can land between two
+    flips and cost a frame. Collection is disabled on entry and a full
+    collection runs on exit, i.e. between blocks where timing does not matter.
+    Nested use is safe: only the outermost exit re-enables the collector.
+
+    Can be used as ``with gc_paused():`` or as a ``@gc_paused()`` decorator.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+            gc.collect()
+
+
+@contextmanager
+def no_vsync(win: visual.Window) -> Iterator[None]:
+    """
+    Let ``win.flip()`` return without blocking on the GPU finish.
+
+    Clearing ``win.waitBlanking`` only skips the ``glFinish`` PsychoPy does
+    after the buffer swap. The swap interval is fixed when the window is
+    created, so the swap itself still waits for the refresh. The flip just no
+    longer holds the caller until the frame is done.
+
+    Only for screens that flip occasionally (e.g. once per second on a
+    countdown), where blocking on the finish buys nothing. Loops that flip
+    every frame, and all stimulus presentation, must keep the default
+    ``waitBlanking=True`` so flip times and onset triggers stay locked to the
+    refresh.
+    """
+    previous = win.waitBlanking
+    win.waitBlanking = False
+    try:
+        yield
+    finally:
+        win.waitBlanking = previous
+
+
 # =============================================================================
 #  SECTION 3: GRID & VISUAL RENDERING
 # =============================================================================
 
 
+def _serpentine(offsets: np.ndarray, reach: int) -> np.ndarray:
+    """
+    Return the vertices of parallel lines joined end to end.
+
+    Row ``2*i`` and ``2*i + 1`` are the two ends of the line at ``offsets[i]``
+    as ``(offset, end)`` pairs. The ends alternate ``-reach, +reach`` and
+    ``+reach, -reach`` so consecutive lines connect at the same side.
+    """
+    ends = np.resize([-reach, reach, reach, -reach], 2 * len(offsets))
+    return np.column_stack([np.repeat(offsets, 2), ends])
+
+
 def create_grid_lines(win: visual.Window) -> List[visual.ShapeStim]:
     """
     Construct a reusable, faint grid sized to the current window.
 
     The grid is cosmetic and intended as a neutral low-contrast background.
+    All grid lines are packed into one open `ShapeStim`, so the grid costs a
+    single draw call per frame.
 
     Parameters
     ----------
@@ -911,7 +1046,7 @@ def create_grid_lines(win: visual.Window) -> List[visual.ShapeStim]:
     Returns
     -------
     List[visual.ShapeStim]
-        Pre-built line stimuli ready to be drawn.
+        Pre-built line stimuli ready to be drawn (a single stimulus).
 
     Notes
     -----
@@ -919,45 +1054,39 @@ def create_grid_lines(win: visual.Window) -> List[visual.ShapeStim]:
       - grid.spacing
       - grid.color
       - grid.opacity
+
+    A `ShapeStim` draws one connected line strip, so the lines are joined in
+    a serpentine. Each line is stretched one grid spacing past the window
+    edge, and the joining segments run entirely off-screen. The visible
+    result is the same as drawing every line separately.
     """
     spacing = int(get_param("grid.spacing", 100))
     color = get_param("grid.color", "gray")
     opacity = float(get_param("grid.opacity", 0.2))
 
     w, h = win.size
-    lines: List[visual.ShapeStim] = []
-
-    # Vertical lines
-    x = -w // 2
-    while x <= w // 2:
-        lines.append(
-            visual.ShapeStim(
-                win,
-                vertices=[(x, -h // 2), (x, h // 2)],
-                lineColor=color,
-                opacity=opacity,
-                closeShape=False,
-                autoLog=False,
-            )
-        )
-        x += spacing
-
-    # Horizontal lines
-    y = -h // 2
-    while y <= h // 2:
-        lines.append(
-            visual.ShapeStim(
-                win,
-                vertices=[(-w // 2, y), (w // 2, y)],
-                lineColor=color,
-                opacity=opacity,
-                closeShape=False,
-                autoLog=False,
-            )
-        )
-        y += spacing
-
-    return lines
+    x_positions = np.arange(-w // 2, w // 2 + 1, spacing)
+    y_positions = np.arange(-h // 2, h // 2 + 1, spacing)
+    # Off-screen extents for line ends and the segments joining them
+    x_out = w // 2 + spacing
+    y_out = h // 2 + spacing
+
+    # Vertical lines, alternating bottom->top and top->bottom
+    vertical = _serpentine(x_positions, y_out)
+    # Horizontal lines, alternating left->right and right->left
+    horizontal = _serpentine(y_positions, x_out)[:, ::-1]
+    # Move off-screen to the left edge before the horizontal lines start
+    vertices = np.vstack([vertical, [(-x_out, vertical[-1, 1])], horizontal])
+
+    grid = visual.ShapeStim(
+        win,
+        vertices=vertices,
+        lineColor=color,
+        opacity=opacity,
+        closeShape=False,
+        autoLog=False,
+    )
+    return [grid]
 
 
 def set_grid_lines(lines: Iterable[visual.ShapeStim]) -> None:
@@ -973,8 +1102,31 @@ def set_grid_lines(lines: Iterable[visual.ShapeStim]) -> None:
     -------
     None
     """
-    global _GRID_LINES
+    global _GRID_LINES, _GRID_IMAGE
     _GRID_LINES = list(lines)
+    _GRID_IMAGE = None
+
+
+def bake_grid(win: visual.Window) -> None:
+    """
+    Render the registered grid once into a texture that `draw_grid` reuses.
+
+    The snapshot covers the whole window, background included, so after
+    baking `draw_grid` must be the first thing drawn in each frame. Calling
+    `set_grid_lines` again drops the snapshot.
+
+    Parameters
+    ----------
+    win : psychopy.visual.Window
+        PsychoPy window the grid lines were built for.
+
+    Returns
+    -------
+    None
+    """
+    global _GRID_IMAGE
+    _GRID_IMAGE = visual.BufferImageStim(win, stim=_GRID_LINES)
+    win.clearBuffer()
 
 
 def draw_grid() -> None:
@@ -988,19 +1140,44 @@ def draw_grid() -> None:
     Notes
     -----
     You must call `set_grid_lines` once per session to cache the lines.
+    If `bake_grid` has been called, the snapshot is drawn instead.
     This function does not call `win.flip()`.
     """
+    if _GRID_IMAGE is not None:
+        _GRID_IMAGE.draw()
+        return
     for line in _GRID_LINES:
         line.draw()
 
 
+@lru_cache(maxsize=8)
+def _grid_geometry(
+    grid_size: int, grid_length: float = 480
+) -> Tuple[float, Tuple[Tuple[Tuple[float, float], ...], ...]]:
+    """
+    Internal helper: cell length and cell centres of a square Dual grid.
+
+    Centres are indexed ``[col][row]`` with row 0 at the top, matching the
+    ``(col, row)`` positions used by the Dual task.
+    """
+    cell = float(grid_length) / float(grid_size)
+    offsets = (np.arange(grid_size) + 0.5) * cell
+    xs = offsets - grid_length / 2.0
+    ys = grid_length / 2.0 - offsets
+    centres = np.stack(np.meshgrid(xs, ys, indexing="ij"), axis=-1)
+    return cell, tuple(tuple(map(tuple, column)) for column in centres.tolist())
+
+
 def create_grid(
     win: visual.Window,
     grid_size: int,
     grid_length: float = 480,
-) -> Tuple[List[visual.Rect], visual.Rect]:
+) -> Tuple[List[visual.ShapeStim], visual.Rect]:
     """
-    Create a square grid of rectangles for Dual N-back tasks.
+    Create a square grid of cells for Dual N-back tasks.
+
+    All cell edges are packed into one open `ShapeStim`, so the cells cost a
+    single draw call per frame instead of one per cell.
 
     Parameters
     ----------
@@ -1013,28 +1190,34 @@ def create_grid(
 
     Returns
     -------
-    Tuple[List[visual.Rect], visual.Rect]
-        A tuple `(cells, outline)` where `cells` is a list of cell rectangles
-        and `outline` is one rectangle that frames the grid.
-    """
-    cell = grid_length / float(grid_size)
-    top_left = (-grid_length / 2.0, grid_length / 2.0)
-
-    cells: List[visual.Rect] = []
-    for col in range(grid_size):
-        for row in range(grid_size):
-            cx = top_left[0] + (col + 0.5) * cell
-            cy = top_left[1] - (row + 0.5) * cell
-            cells.append(
-                visual.Rect(
-                    win,
-                    width=cell,
-                    height=cell,
-                    pos=(cx, cy),
-                    lineColor="white",
-                    fillColor=None,
-                )
-            )
+    Tuple[List[visual.ShapeStim], visual.Rect]
+        A tuple `(cells, outline)` where `cells` is a list holding the single
+        stimulus that draws every cell edge, and `outline` is one rectangle
+        that frames the grid. Callers colour and draw `cells` by iterating it.
+
+    Notes
+    -----
+    As in `create_grid_lines`, the edges are joined in a serpentine. Here
+    every joining segment runs along the grid border, which is itself a cell
+    edge, so the result looks the same as drawing each cell separately.
+    """
+    half = grid_length / 2.0
+    edges = np.linspace(-half, half, grid_size + 1)
+
+    # Vertical edges, alternating bottom->top and top->bottom
+    vertical = _serpentine(edges, half)
+    # Horizontal edges start on the border where the vertical ones finished
+    if vertical[-1, 1] > 0:
+        edges = edges[::-1]
+    horizontal = _serpentine(edges, half)[:, ::-1]
+
+    cells = visual.ShapeStim(
+        win,
+        vertices=np.vstack([vertical, horizontal]),
+        lineColor="white",
+        fillColor=None,
+        closeShape=False,
+    )
 
     outline = visual.Rect(
         win,
@@ -1045,7 +1228,7 @@ def create_grid(
         fillColor=None,
         lineWidth=2,
     )
-    return cells, outline
+    return [cells], outline
 
 
 def get_level_color(n_level: Optional[int]) -> str:
@@ -1076,6 +1259,54 @@ def get_level_color(n_level: Optional[int]) -> str:
     )
 
 
+# Centres of the 12 radial cells used by the spatial task (radius 150 px)
+_RADIAL_POSITIONS: Tuple[Tuple[float, float], ...] = tuple(
+    (150 * math.cos(math.radians(a)), 150 * math.sin(math.radians(a)))
+    for a in (i * (360.0 / 12) for i in range(12))
+)
+# Stims reused by display_grid, built for one window by _radial_grid_stims
+_RADIAL_STIMS: Dict[str, Any] = {}
+
+
+def _radial_grid_stims(win: visual.Window) -> Dict[str, Any]:
+    """Return the cached radial-grid stims, building them for a new window."""
+    if _RADIAL_STIMS.get("win") is win:
+        return _RADIAL_STIMS
+
+    _RADIAL_STIMS.clear()
+    _RADIAL_STIMS.update(
+        win=win,
+        color=get_level_color(None),
+        color_n=None,
+        level_n=None,
+        fixation=visual.TextStim(win, text="+", color="white", height=32),
+        cells=[
+            visual.Rect(
+                win,
+                width=50,
+                height=50,
+                pos=pos,
+                lineColor=get_level_color(None),
+                lineWidth=2,
+                fillColor=None,
+            )
+            for pos in _RADIAL_POSITIONS
+        ],
+        highlight=visual.Rect(win, width=50, height=50, fillColor="white"),
+        feedback=visual.TextStim(win, text="", height=24, pos=(0, 250)),
+        lapse=visual.TextStim(win, text="", color="orange", height=24, pos=(0, 300)),
+        level=visual.TextStim(
+            win,
+            text="",
+            color="white",
+            height=24,
+            pos=(-450, 350),
+            alignText="left",
+        ),
+    )
+    return _RADIAL_STIMS
+
+
 def display_grid(
     win: visual.Window,
     highlight_pos: Optional[int] = None,
@@ -1087,6 +1318,10 @@ def display_grid(
     """
     Draw the radial 12-position grid, with optional highlight and messages.
 
+    The cells, highlight and text stims are built on the first call for a
+    window and reused afterwards; only changed text and colours are updated,
+    and the level colour is looked up only when `n_level` changes.
+
     Parameters
     ----------
     win : psychopy.visual.Window
@@ -1106,61 +1341,50 @@ def display_grid(
     -------
     None
     """
-    import math
+    stims = _radial_grid_stims(win)
 
     draw_grid()
 
-    radius = 150
-    num_positions = 12
-    angles = [i * (360.0 / num_positions) for i in range(num_positions)]
-    positions = [
-        (radius * math.cos(math.radians(a)), radius * math.sin(math.radians(a)))
-        for a in angles
-    ]
-
-    grid_color = get_level_color(n_level)
-
     # Fixation cross
-    visual.TextStim(win, text="+", color="white", height=32).draw()
-
-    # 12 squares around the circle
-    for pos in positions:
-        visual.Rect(
-            win,
-            width=50,
-            height=50,
-            pos=pos,
-            lineColor=grid_color,
-            lineWidth=2,
-            fillColor=None,
-        ).draw()
+    stims["fixation"].draw()
+
+    # 12 squares around the circle; the level colour is looked up and the
+    # cells recoloured only when the level changes
+    if stims["color_n"] != n_level:
+        stims["color_n"] = n_level
+        level_color = get_level_color(n_level)
+        if stims["color"] != level_color:
+            for cell in stims["cells"]:
+                cell.lineColor = level_color
+            stims["color"] = level_color
+    grid_color = stims["color"]
+    for cell in stims["cells"]:
+        cell.draw()
 
     # Optional highlight
     if highlight and highlight_pos is not None:
-        visual.Rect(
-            win, width=50, height=50, pos=positions[highlight_pos], fillColor="white"
-        ).draw()
+        stims["highlight"].pos = _RADIAL_POSITIONS[highlight_pos]
+        stims["highlight"].draw()
 
     # Optional texts
     if feedback_text:
-        visual.TextStim(
-            win, text=feedback_text, color=grid_color, height=24, pos=(0, 250)
-        ).draw()
+        feedback = stims["feedback"]
+        if feedback.text != feedback_text:
+            feedback.text = feedback_text
+        feedback.color = grid_color
+        feedback.draw()
 
     if lapse_feedback:
-        visual.TextStim(
-            win, text=lapse_feedback, color="orange", height=24, pos=(0, 300)
-        ).draw()
+        lapse = stims["lapse"]
+        if lapse.text != lapse_feedback:
+            lapse.text = lapse_feedback
+        lapse.draw()
 
     if n_level:
-        visual.TextStim(
-            win,
-            text=get_text("level_label", n=n_level),
-            color="white",
-            height=24,
-            pos=(-450, 350),
-            alignText="left",
-        ).draw()
+        if stims["level_n"] != n_level:
+            stims["level"].text = get_text("level_label", n=n_level)
+            stims["level_n"] = n_level
+        stims["level"].draw()
 
 
 def display_dual_stimulus(
@@ -1177,6 +1401,7 @@ def display_dual_stimulus(
     grid_length: float = 480,
     include_highlight: bool = True,
     flip_if_drawn: bool = True,
+    highlight: Optional[visual.Rect] = None,
 ):
     """
     Build and optionally draw the highlight and image for one Dual N-back trial.
@@ -1214,6 +1439,9 @@ def display_dual_stimulus(
     flip_if_drawn : bool, optional
         If True and the function draws, call `win.flip()` before returning.
         Default is True.
+    highlight : Optional[visual.Rect], optional
+        Existing highlight rect to reuse. Only its position is updated, so the
+        caller sets its size and colour. Default is None, which builds a new rect.
 
     Returns
     -------
@@ -1229,18 +1457,20 @@ def display_dual_stimulus(
     - Full induction calls with `return_stims=True` and draws stims itself.
     - Practice calls with `return_stim=True` and draws the image itself.
     """
-    # Compute cell centre for the target position
-    cell_len = float(grid_length) / float(grid_size)
-    top_left = (-grid_length / 2.0, grid_length / 2.0)
-    cx = top_left[0] + pos[0] * cell_len + cell_len / 2.0
-    cy = top_left[1] - pos[1] * cell_len - cell_len / 2.0
+    # Cell centre for the target position
+    cell_len, centres = _grid_geometry(grid_size, grid_length)
+    cx, cy = centres[pos[0]][pos[1]]
+    img_size = (cell_len - 10, cell_len - 10)
 
     # Level colour
     lvl_color = get_level_color(n_level)
 
     # Highlight rect under the image
     highlight_rect = None
-    if include_highlight:
+    if include_highlight and highlight is not None:
+        highlight.pos = (cx, cy)
+        highlight_rect = highlight
+    elif include_highlight:
         highlight_rect = visual.Rect(
             win,
             width=cell_len,
@@ -1257,8 +1487,6 @@ def display_dual_stimulus(
     # 1) explicit preloaded dict
     if isinstance(preloaded_images, dict) and image_file in preloaded_images:
         img_stim = preloaded_images[image_file]
-        img_stim.pos = (cx, cy)
-        img_stim.size = (cell_len - 10, cell_len - 10)
 
     # 2) caller globals for a dict named preloaded_images_dual
     if img_stim is None:
@@ -1266,8 +1494,13 @@ def display_dual_stimulus(
         caller_preloaded = caller_globals.get("preloaded_images_dual")
         if isinstance(caller_preloaded, dict) and image_file in caller_preloaded:
             img_stim = caller_preloaded[image_file]
-            img_stim.pos = (cx, cy)
-            img_stim.size = (cell_len - 10, cell_len - 10)
+
+    if img_stim is not None:
+        # Preloaded stims are normally built at the cell size already; only a
+        # mismatch is written, since setting size rebuilds the stim's geometry
+        img_stim.pos = (cx, cy)
+        if not np.array_equal(img_stim.size, img_size):
+            img_stim.size = img_size
 
     # 3) fall back to loading from disk
     if img_stim is None:
@@ -1282,12 +1515,7 @@ def display_dual_stimulus(
             if os.path.isabs(image_file)
             else os.path.join(image_dir, image_file)
         )
-        img_stim = visual.ImageStim(
-            win,
-            image=path,
-            pos=(cx, cy),
-            size=(cell_len - 10, cell_len - 10),
-        )
+        img_stim = visual.ImageStim(win, image=path, pos=(cx, cy), size=img_size)
 
     # Return paths for the two scripts
     if return_stims:
@@ -1375,6 +1603,57 @@ def get_jitter(base_seconds: float) -> float:
     return random.uniform(low, high)
 
 
+def get_jitter_array(
+    base_seconds: float,
+    n: int,
+    rng: Optional[np.random.Generator] = None,
+) -> np.ndarray:
+    """
+    Return `n` jittered durations around a base value in one NumPy draw.
+
+    Vectorised form of `get_jitter` for drawing a whole block's timings up
+    front. The range comes from the same `timing.jitter_fraction` param.
+
+    Parameters
+    ----------
+    base_seconds : float
+        The nominal duration in seconds.
+    n : int
+        Number of durations to draw.
+    rng : numpy.random.Generator, optional
+        Generator to draw from. A fresh unseeded one is used if omitted.
+
+    Returns
+    -------
+    numpy.ndarray
+        `n` values uniform in `[base*(1 - j), base*(1 + j)]`.
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    frac = float(get_param("timing.jitter_fraction", 0.10))
+    low = base_seconds * (1.0 - frac)
+    high = base_seconds * (1.0 + frac)
+    return rng.uniform(low, high, n)
+
+
+def _nback_sources(target_idxs: np.ndarray, n: int, length: int) -> np.ndarray:
+    """
+    Internal helper: the non-target index each target should copy.
+
+    Each target is walked back n at a time past any chained targets to the
+    filler it repeats, so a single ``seq[targets] = seq[sources]`` write makes
+    every sampled index a true n-back repeat.
+    """
+    is_target = np.zeros(length, dtype=bool)
+    is_target[target_idxs] = True
+    sources = target_idxs - n
+    chained = is_target[sources]
+    while chained.any():
+        sources[chained] -= n
+        chained = is_target[sources]
+    return sources
+
+
 def generate_positions_with_matches(
     num_positions: int,
     n: int,
@@ -1400,22 +1679,21 @@ def generate_positions_with_matches(
 
     Notes
     -----
-    Target indices are sampled uniformly from the eligible range `[n, num_positions)`.
-    Non-targets are sampled freely. The function does not guarantee absence of
+    Target indices are sampled uniformly from the eligible range `[n, num_positions)`
+    and every one of them repeats the position `n` trials back, including runs
+    of targets. Non-targets are sampled freely. The function does not guarantee absence of
     incidental 2-back repeats when `n` is not equal to 2.
     """
-    positions = list(range(12))
-    seq: List[int] = [random.choice(positions) for _ in range(num_positions)]
+    seq = np.array(random.choices(range(12), k=num_positions))
 
     n_targets = int((num_positions - n) * float(target_percentage))
     n_targets = max(0, min(n_targets, max(0, num_positions - n)))
 
     if n_targets > 0:
-        target_idxs = random.sample(range(n, num_positions), n_targets)
-        for idx in target_idxs:
-            seq[idx] = seq[idx - n]
+        target_idxs = np.array(random.sample(range(n, num_positions), n_targets))
+        seq[target_idxs] = seq[_nback_sources(target_idxs, n, num_positions)]
 
-    return seq
+    return seq.tolist()
 
 
 def generate_dual_nback_sequence(
@@ -1450,24 +1728,57 @@ def generate_dual_nback_sequence(
     Notes
     -----
     The target rate is enforced on the eligible range `[n, num_trials)`.
+    Positions and images are drawn as index arrays by a NumPy generator
+    seeded from the `random` module, so `random.seed` still fixes the
+    sequence.
     """
     target_rate = max(0.0, min(1.0, target_rate))
     positions = [(x, y) for x in range(grid_size) for y in range(grid_size)]
-    pos_seq = [random.choice(positions) for _ in range(num_trials)]
-    image_seq = [random.choice(image_files) for _ in range(num_trials)]
+    rng = np.random.default_rng(random.getrandbits(64))
+    pos_idx = rng.integers(0, len(positions), size=num_trials)
+    img_idx = rng.integers(0, len(image_files), size=num_trials)
 
-    num_targets = int((num_trials - n) * target_rate)
-    target_indices = random.sample(range(n, num_trials), num_targets)
+    num_targets = max(0, int((num_trials - n) * target_rate))
+    if num_targets > 0:
+        target_indices = rng.choice(num_trials - n, size=num_targets, replace=False)
+        target_indices += n
+        sources = _nback_sources(target_indices, n, num_trials)
+        pos_idx[target_indices] = pos_idx[sources]
+        img_idx[target_indices] = img_idx[sources]
 
-    for idx in target_indices:
-        pos_seq[idx] = pos_seq[idx - n]
-        image_seq[idx] = image_seq[idx - n]
+    pos_seq = [positions[p] for p in pos_idx.tolist()]
+    image_seq = [image_files[i] for i in img_idx.tolist()]
 
     combined_seq = list(zip(pos_seq, image_seq))
     print_debug_info(combined_seq, n, is_dual=True)
     return pos_seq, image_seq
 
 
+def _pick_non_repeat(
+    pool: List[str],
+    window: Iterable[str],
+    two_back: Optional[str],
+    attempts: int = 8,
+) -> int:
+    """
+    Return the index of a random pool image not in `window` or equal to `two_back`.
+
+    The window and the 2-back image are merged into one set of forbidden
+    images, so each check is a single hash lookup. Random indices are tried
+    first. If every try collides, the allowed images are listed and one is
+    chosen. If none are allowed, any image is returned. The pick is uniform
+    over the allowed images either way.
+    """
+    forbidden = set(window)
+    forbidden.add(two_back)
+    for _ in range(attempts):
+        idx = random.randrange(len(pool))
+        if pool[idx] not in forbidden:
+            return idx
+    allowed = [idx for idx, img in enumerate(pool) if img not in forbidden]
+    return random.choice(allowed) if allowed else random.randrange(len(pool))
+
+
 def generate_sequential_image_sequence(
     num_trials: int,
     n: int,
@@ -1516,6 +1827,8 @@ def generate_sequential_image_sequence(
     random.shuffle(available_images)
 
     sequence: List[str] = []
+    # The last n images, for the unintended-repeat check
+    recent: Deque[str] = deque(maxlen=n)
     max_consecutive_matches = int(get_param("sequential.max_consecutive_matches", 2))
     consecutive_count = 0
 
@@ -1526,10 +1839,13 @@ def generate_sequential_image_sequence(
     else:
         yes_positions = []
 
+    # Membership is tested every trial; the sorted list is still what's returned
+    yes_set = set(yes_positions)
     for i in range(num_trials):
-        if i in yes_positions and consecutive_count < max_consecutive_matches:
+        if i in yes_set and consecutive_count < max_consecutive_matches:
             # true N-back match
             sequence.append(sequence[i - n])
+            recent.append(sequence[-1])
             consecutive_count += 1
             continue
 
@@ -1538,18 +1854,15 @@ def generate_sequential_image_sequence(
             random.shuffle(available_images)
 
         # avoid unintended n-back or 2-back repeats where possible
-        candidates = [
-            img
-            for img in available_images
-            if (len(sequence) < n or img not in sequence[-n:])
-            and (len(sequence) < 2 or img != sequence[-2])
-        ]
-        if not candidates:
-            candidates = available_images
-
-        chosen = random.choice(candidates)
+        window = recent if len(sequence) >= n else ()
+        two_back = sequence[-2] if len(sequence) >= 2 else None
+        chosen_idx = _pick_non_repeat(available_images, window, two_back)
+        chosen = available_images[chosen_idx]
+        # swap-remove: order is irrelevant because picks use random indices
+        available_images[chosen_idx] = available_images[-1]
+        available_images.pop()
         sequence.append(chosen)
-        available_images.remove(chosen)
+        recent.append(chosen)
         consecutive_count = 0
 
     return sequence, yes_positions
@@ -1574,11 +1887,13 @@ __all__ = [
     "install_error_hook",
     "create_grid_lines",
     "set_grid_lines",
+    "bake_grid",
     "draw_grid",
     "display_grid",
     "create_grid",
     "get_level_color",
     "get_jitter",
+    "get_jitter_array",
     "generate_dual_nback_sequence",
     "generate_positions_with_matches",
     "generate_sequential_image_sequence",
@@ -1589,4 +1904,6 @@ __all__ = [
     "show_text_screen",
     "check_response_keys",
     "collect_trial_response",
+    "gc_paused",
+    "no_vsync",
 ]
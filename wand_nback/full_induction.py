@@ -33,21 +33,36 @@ MIT (see LICENSE).
 # =============================================================================
 
 import argparse
+import atexit
 import csv
+import io
+import json
 import logging
+import logging.handlers
 import os
+import queue
 import random
 import sys
 import time
+from dataclasses import dataclass
 from datetime import datetime
+from operator import attrgetter
+
+import numpy as np
 
 print("Starting WAND, this may take a moment...", flush=True)
 
 from psychopy import core, event, visual
 
-from wand_nback.analysis import summarise_sequential_block
+from wand_nback.analysis import (
+    Resp,
+    as_trial_records,
+    summarise_sequential_block,
+    trial_dtype,
+)
 from wand_nback.block_order import build_standard_block_order
 from wand_nback.common import (
+    bake_grid,
     collect_trial_response,
     create_grid,
     create_grid_lines,
@@ -55,10 +70,11 @@ from wand_nback.common import (
     display_grid,
     draw_grid,
     emergency_quit,
+    gc_paused,
     generate_dual_nback_sequence,
     generate_positions_with_matches,
     generate_sequential_image_sequence,
-    get_jitter,
+    get_jitter_array,
     get_level_color,
     get_param,
     get_response_keys,
@@ -66,12 +82,28 @@ from wand_nback.common import (
     get_text,
     install_error_hook,
     load_config,
+    load_gui_config,
+    no_vsync,
     prompt_choice,
     prompt_text_input,
     set_grid_lines,
     show_text_screen,
 )
 
+# The performance monitor is optional; its checks are skipped without it
+try:
+    from wand_nback.performance_monitor import (
+        MonitorConfig,
+        check_adaptive_block,
+        check_sequential_block,
+        handle_flag,
+        reset_flag_count,
+    )
+
+    _HAVE_MONITOR = True
+except ImportError:
+    _HAVE_MONITOR = False
+
 # --------------- CLI FLAGS (dummy‑run only) ---------------
 parser = argparse.ArgumentParser(add_help=False)
 parser.add_argument("--seed", type=int, default=None)
@@ -81,6 +113,18 @@ args, _ = parser.parse_known_args()
 
 GLOBAL_SEED = args.seed  # None → random each run
 DISTRACTORS_ENABLED = (args.distractors != "off") if args.distractors else True
+# NumPy draws in this module (e.g. distractor placement); reseeded per session
+RNG = np.random.default_rng(GLOBAL_SEED)
+
+
+def _make_jitter_rng(seed):
+    """Return a timing-jitter generator whose stream is independent of ``RNG``."""
+    return np.random.default_rng(np.random.SeedSequence(seed).spawn(1)[0])
+
+
+# Per-trial timing jitter has its own stream, so block length never shifts
+# the seeded draws made from RNG
+JITTER_RNG = _make_jitter_rng(GLOBAL_SEED)
 
 # Dependency Check
 try:
@@ -98,6 +142,34 @@ if getattr(sys, "frozen", False):
 else:
     base_dir = os.path.dirname(os.path.abspath(__file__))
 
+# Output folder for CSVs and participant logs (created by `_init_paths`)
+DATA_DIR = os.path.join(base_dir, "data")
+# Session start stamp (YYYYMMDD-HHMMSS), set once by each entry point
+SESSION_TS = None
+_DATA_DIR_READY = False
+
+
+def _init_paths():
+    """
+    Create the data folder before a session starts.
+
+    Called at the top of each entry point so an unwritable location fails
+    before the participant has started, not at the first save. Only the first
+    call touches the filesystem; later calls (e.g. from every CSV save) return
+    immediately.
+
+    Returns
+    -------
+    str
+        The data directory, `DATA_DIR`.
+    """
+    global _DATA_DIR_READY
+    if not _DATA_DIR_READY:
+        os.makedirs(DATA_DIR, exist_ok=True)
+        _DATA_DIR_READY = True
+    return DATA_DIR
+
+
 # Load Configuration
 CONFIG_DIR = os.path.join(base_dir, "config")
 load_config(lang="en", config_dir=CONFIG_DIR)
@@ -118,12 +190,31 @@ image_dir = os.path.join(base_dir, "stimuli", "apophysis")
 # =============================================================================
 
 
-class FlushFileHandler(logging.FileHandler):
-    """Custom file handler that flushes after every log record."""
+class BufferedFileHandler(logging.FileHandler):
+    """File handler that writes records without flushing each one."""
 
     def emit(self, record):
-        super().emit(record)
-        self.flush()
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+
+class DrainingQueueListener(logging.handlers.QueueListener):
+    """Queue listener that flushes its handlers whenever the queue runs dry."""
+
+    def handle(self, record):
+        super().handle(record)
+        if self.queue.empty():
+            for handler in self.handlers:
+                handler.flush()
+
+    def stop(self):
+        """Drain the queue and stop; a no-op if already stopped."""
+        if self._thread is not None:
+            super().stop()
 
 
 # === Logging Configuration ===
@@ -165,6 +256,8 @@ except ImportError:
 install_error_hook(win)
 grid_lines = create_grid_lines(win)
 set_grid_lines(grid_lines)
+# Every frame in this script starts with the grid, so it can be one texture
+bake_grid(win)
 event.globalKeys.add(key="escape", func=core.quit)
 
 # =============================================================================
@@ -175,8 +268,12 @@ event.globalKeys.add(key="escape", func=core.quit)
 if not os.path.exists(image_dir):
     raise FileNotFoundError(f"The image directory does not exist: {image_dir}")
 
-# Get the list of image files
-image_files = [f for f in os.listdir(image_dir) if f.endswith(".png")]
+# Get the list of image files, sorted so seeded image draws do not depend
+# on filesystem listing order
+with os.scandir(image_dir) as entries:
+    image_files = sorted(
+        e.name for e in entries if e.is_file() and e.name.endswith(".png")
+    )
 
 # Print the image directory path and number of files found to verify
 logging.debug(f"Image directory: {image_dir}")
@@ -201,9 +298,10 @@ preloaded_images_sequential = {
     for image_file in image_files
 }
 
+# Dual images are built at their grid-cell size (480 px grid / 3, 10 px inset)
 preloaded_images_dual = {
     image_file: visual.ImageStim(
-        win, image=os.path.join(image_dir, image_file), size=(100, 100)
+        win, image=os.path.join(image_dir, image_file), size=(150, 150)
     )
     for image_file in image_files
 }
@@ -361,8 +459,6 @@ def get_participant_info(win):
     # ─────────────────────────────────────────────────────────────────────────
     # Check for GUI config first
     # ─────────────────────────────────────────────────────────────────────────
-    from wand_nback.common import load_gui_config
-
     gui_config = load_gui_config()
 
     if gui_config:
@@ -436,6 +532,63 @@ def get_participant_info(win):
     }
 
 
+def _csv_field(value):
+    """
+    Format one cell exactly as `csv.writer` (default dialect) would.
+
+    Parameters
+    ----------
+    value : Any
+        Cell value; None becomes an empty cell.
+
+    Returns
+    -------
+    str
+        The cell text, quoted only if it contains a comma, quote or newline.
+    """
+    if value is None:
+        return ""
+    text = str(value)
+    if any(c in text for c in ',"\r\n'):
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+
+# Column order of the four Likert scores returned by collect_subjective_measures
+SUBJECTIVE_MEASURE_LABELS = (
+    "Mental Fatigue",
+    "Task Effort",
+    "Mind Wandering",
+    "Overwhelmed",
+)
+
+
+@dataclass
+class BlockResult:
+    """One block's metrics as written to the results CSV."""
+
+    participant_id: str = "Unknown"
+    task: str = "Unknown Task"
+    block: object = "Unknown Block"
+    n_back_level: object = "Unknown"
+    results: object = None
+
+    @classmethod
+    def from_dict(cls, record):
+        """Build from the legacy ``{"Participant ID": ..., "Results": ...}`` dict."""
+        return cls(
+            participant_id=record.get("Participant ID", "Unknown"),
+            task=record.get("Task", "Unknown Task"),
+            block=record.get("Block", "Unknown Block"),
+            n_back_level=record.get("N-back Level", "Unknown"),
+            results=record.get("Results"),
+        )
+
+
+# The four leading CSV cells shared by every row of a BlockResult
+_ROW_KEY = attrgetter("participant_id", "task", "block", "n_back_level")
+
+
 def save_results_to_csv(
     filename, results, subjective_measures=None, mode="w", participant_id=None
 ):
@@ -446,13 +599,9 @@ def save_results_to_csv(
     ----------
     filename : str
         Base name of the CSV (e.g., 'participant_01_results.csv').
-    results : List[dict]
-        Each dict must contain:
-        - 'Participant ID' : str
-        - 'Task'           : str
-        - 'Block'          : Union[int, str]
-        - 'N-back Level'   : Optional[int]
-        - 'Results'        : dict  (block metrics)
+    results : List[BlockResult]
+        One entry per block. Plain dicts with the keys 'Participant ID',
+        'Task', 'Block', 'N-back Level' and 'Results' are also accepted.
     subjective_measures : Optional[dict], optional
         Mapping of time-point labels to four scores
         [Mental Fatigue, Task Effort, Mind Wandering, Overwhelmed], by default None.
@@ -470,30 +619,28 @@ def save_results_to_csv(
     - Writes a provenance row indicating the RNG seed used.
     """
     logging.info(f"Starting to save results to {filename}")
-    data_dir = os.path.join(base_dir, "data")
-    os.makedirs(data_dir, exist_ok=True)
-
-    full_path = os.path.join(data_dir, filename)
+    full_path = os.path.join(_init_paths(), filename)
     logging.info(f"Saving results to: {full_path}")
 
     try:
-        with open(full_path, mode=mode, newline="") as file:
-            writer = csv.writer(file)
-
-            # Default participant_id in case results is empty
-            if participant_id is None:
-                participant_id = "Unknown"
-
-            # ─────────────────────────────────────────────────────────
-            #   first‑time header rows  (only if we are *creating* file)
-            # ─────────────────────────────────────────────────────────
-            if mode == "w":
-                # provenance row: record the seed or the fact it was random
-                writer.writerow(
-                    ["Seed Used", GLOBAL_SEED if GLOBAL_SEED is not None else "random"]
-                )
-                # standard behavioural header row
-                writer.writerow(
+        # Rows are rendered in memory and written to disk in one call, so a
+        # save costs a single write and never leaves a half-written block
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+
+        # Default participant_id in case results is empty
+        if participant_id is None:
+            participant_id = "Unknown"
+
+        # ─────────────────────────────────────────────────────────
+        #   first‑time header rows  (only if we are *creating* file)
+        # ─────────────────────────────────────────────────────────
+        if mode == "w":
+            writer.writerows(
+                [
+                    # provenance row: record the seed or the fact it was random
+                    ["Seed Used", GLOBAL_SEED if GLOBAL_SEED is not None else "random"],
+                    # standard behavioural header row
                     [
                         "Participant ID",
                         "Task",
@@ -501,105 +648,92 @@ def save_results_to_csv(
                         "N-back Level",
                         "Measure",
                         "Value",
-                    ]
-                )
-                logging.debug("Headers + seed row written")
+                    ],
+                ]
+            )
+            logging.debug("Headers + seed row written")
+
+        # ─────────────────────────────────────────────────────────
+        #   behavioural results blocks
+        # ─────────────────────────────────────────────────────────
+        debug_enabled = logging.getLogger().isEnabledFor(logging.DEBUG)
+        for i, result in enumerate(results):
+            if debug_enabled:
+                logging.debug("Processing result %d", i + 1)
+            try:
+                if isinstance(result, dict):
+                    result = BlockResult.from_dict(result)
+                participant_id = result.participant_id
+                data = result.results
+
+                if isinstance(data, dict):
+                    # The four leading cells are shared by every row of the
+                    # result, so they are formatted once
+                    row_prefix = ",".join(_csv_field(v) for v in _ROW_KEY(result))
+                    # overall metrics
+                    for measure in [
+                        "Correct Responses",
+                        "Incorrect Responses",
+                        "Lapses",
+                        "Accuracy",
+                        "Total Reaction Time",
+                        "Average Reaction Time",
+                        "Overall D-Prime",
+                        # Add full SDT metrics
+                        "Criterion",
+                        "Hit Rate",
+                        "FA Rate",
+                        "Hits",
+                        "Misses",
+                        "False Alarms",
+                        "Correct Rejections",
+                    ]:
+                        buffer.write(
+                            f"{row_prefix},{measure},"
+                            f"{_csv_field(data.get(measure, 'N/A'))}\r\n"
+                        )
 
-            # ─────────────────────────────────────────────────────────
-            #   behavioural results blocks
-            # ─────────────────────────────────────────────────────────
-            for i, result in enumerate(results):
-                logging.debug(f"Processing result {i + 1}")
-                try:
-                    participant_id = result.get("Participant ID", "Unknown")
-                    task = result.get("Task", "Unknown Task")
-                    block = result.get("Block", "Unknown Block")
-                    n_back_level = result.get("N-back Level", "Unknown")
-                    data = result.get("Results")
-
-                    if isinstance(data, dict):
-                        # overall metrics
-                        for measure in [
-                            "Correct Responses",
-                            "Incorrect Responses",
-                            "Lapses",
-                            "Accuracy",
-                            "Total Reaction Time",
-                            "Average Reaction Time",
-                            "Overall D-Prime",
-                            # Add full SDT metrics
-                            "Criterion",
-                            "Hit Rate",
-                            "FA Rate",
-                            "Hits",
-                            "Misses",
-                            "False Alarms",
-                            "Correct Rejections",
-                        ]:
-                            writer.writerow(
-                                [
-                                    participant_id,
-                                    task,
-                                    block,
-                                    n_back_level,
-                                    measure,
-                                    data.get(measure, "N/A"),
-                                ]
+                    # pre‑ & post‑distractor metrics
+                    for section in [
+                        ("Pre", ["Accuracy", "Avg RT", "A-Prime"]),
+                        ("Post", ["Accuracy", "Avg RT", "A-Prime"]),
+                    ]:
+                        prefix, keys = section
+                        for k in keys:
+                            col_name = f"{prefix}-Distractor {k}"
+                            buffer.write(
+                                f"{row_prefix},{col_name},"
+                                f"{_csv_field(data.get(col_name, 'N/A'))}\r\n"
                             )
+                else:
+                    logging.warning(f"Result {i + 1} has unexpected format: {data}")
 
-                        # pre‑ & post‑distractor metrics
-                        for section in [
-                            ("Pre", ["Accuracy", "Avg RT", "A-Prime"]),
-                            ("Post", ["Accuracy", "Avg RT", "A-Prime"]),
-                        ]:
-                            prefix, keys = section
-                            for k in keys:
-                                col_name = f"{prefix}-Distractor {k}"
-                                writer.writerow(
-                                    [
-                                        participant_id,
-                                        task,
-                                        block,
-                                        n_back_level,
-                                        col_name,
-                                        data.get(col_name, "N/A"),
-                                    ]
-                                )
-                    else:
-                        logging.warning(f"Result {i + 1} has unexpected format: {data}")
-
+            except Exception as e:
+                logging.error(f"Error processing result {i + 1}: {e}")
+                logging.debug("Faulty result data: %s", result)
+                continue  # skip to next result
+
+        # ─────────────────────────────────────────────────────────
+        #   subjective measures block (optional)
+        # ─────────────────────────────────────────────────────────
+        if subjective_measures:
+            logging.info("Writing subjective measures")
+            rows = [[], ["Participant ID", "Time Point", "Measure", "Value"]]
+            for time_point, measures in subjective_measures.items():
+                try:
+                    rows.extend(
+                        [participant_id, time_point, label, measures[i]]
+                        for i, label in enumerate(SUBJECTIVE_MEASURE_LABELS)
+                    )
                 except Exception as e:
-                    logging.error(f"Error processing result {i + 1}: {e}")
-                    logging.debug(f"Faulty result data: {result}")
-                    continue  # skip to next result
-
-            # ─────────────────────────────────────────────────────────
-            #   subjective measures block (optional)
-            # ─────────────────────────────────────────────────────────
-            if subjective_measures:
-                logging.info("Writing subjective measures")
-                writer.writerow([])  # blank line separator
-                writer.writerow(["Participant ID", "Time Point", "Measure", "Value"])
-
-                for time_point, measures in subjective_measures.items():
-                    try:
-                        writer.writerow(
-                            [participant_id, time_point, "Mental Fatigue", measures[0]]
-                        )
-                        writer.writerow(
-                            [participant_id, time_point, "Task Effort", measures[1]]
-                        )
-                        writer.writerow(
-                            [participant_id, time_point, "Mind Wandering", measures[2]]
-                        )
-                        writer.writerow(
-                            [participant_id, time_point, "Overwhelmed", measures[3]]
-                        )
-                    except Exception as e:
-                        logging.error(
-                            f"Error saving subjective measures for {time_point}: {e}"
-                        )
-                        continue
+                    logging.error(
+                        f"Error saving subjective measures for {time_point}: {e}"
+                    )
+                    continue
+            writer.writerows(rows)
+
+        with open(full_path, mode=mode, newline="") as file:
+            file.write(buffer.getvalue())
 
         logging.info(f"Results and subjective measures saved to {full_path}")
         return full_path
@@ -624,6 +758,46 @@ def save_results_to_csv(
         return None
 
 
+def append_trial_stream(filename, participant_id, task, block, trials):
+    """
+    Append one block's trial-level data to a JSON Lines stream.
+
+    Each trial becomes one JSON object on its own line, tagged with the
+    participant, task and block. The whole block is written and flushed at
+    once, so completed blocks survive a later crash and the stream can be
+    read back without parsing the CSVs.
+
+    Parameters
+    ----------
+    filename : str
+        Stream file name inside `DATA_DIR` (e.g. 'participant_01_stream.jsonl').
+    participant_id : str
+        Participant identifier.
+    task : str
+        Task label, e.g. 'Sequential 2-back'.
+    block : Union[int, str]
+        Block label.
+    trials : Union[numpy.ndarray, List[dict]]
+        Trial rows, as accepted by `analysis.as_trial_array`.
+
+    Returns
+    -------
+    Optional[str]
+        Full path to the stream on success, otherwise None.
+    """
+    full_path = os.path.join(_init_paths(), filename)
+    key = {"Participant ID": participant_id, "Task": task, "Block": block}
+    # Records carry response labels and None for a missing reaction time
+    lines = [json.dumps({**key, **record}) for record in as_trial_records(trials)]
+    try:
+        with open(full_path, "a", encoding="utf-8") as stream:
+            stream.write("".join(line + "\n" for line in lines))
+    except OSError as e:
+        logging.error(f"Failed to append trials to {full_path}: {e}")
+        return None
+    return full_path
+
+
 def save_sequential_results(participant_id, n_back_level, block_name, seq_results):
     """
     Save one Sequential N-back block's results to a per-participant CSV.
@@ -647,13 +821,13 @@ def save_sequential_results(participant_id, n_back_level, block_name, seq_result
         f"participant_{participant_id}_n{n_back_level}_{block_name}_results.csv"
     )
     all_results = [
-        {
-            "Participant ID": participant_id,
-            "Task": f"Sequential {n_back_level}-back",
-            "Block": block_name,
-            "N-back Level": n_back_level,
-            "Results": seq_results,
-        },
+        BlockResult(
+            participant_id=participant_id,
+            task=f"Sequential {n_back_level}-back",
+            block=block_name,
+            n_back_level=n_back_level,
+            results=seq_results,
+        ),
     ]
     saved_file_path = save_results_to_csv(results_filename, all_results)
     if saved_file_path:
@@ -667,6 +841,129 @@ def save_sequential_results(participant_id, n_back_level, block_name, seq_result
 # =============================================================================
 
 
+# Reusable full-screen instruction stims, keyed by purpose
+_TEXT_CACHE = {}
+
+
+def get_stim(win, key, text):
+    """
+    Return a cached white instruction TextStim with its text updated.
+
+    Parameters
+    ----------
+    win : psychopy.visual.Window
+        The active PsychoPy window.
+    key : str
+        Purpose of the screen (e.g. ``"familiarisation"``); one stim is kept
+        per key.
+    text : str
+        Text to display.
+
+    Returns
+    -------
+    psychopy.visual.TextStim
+        The cached stim, ready to draw.
+    """
+    stim = _TEXT_CACHE.get(key)
+    if stim is None or stim.win is not win:
+        stim = visual.TextStim(win, color="white", height=24, wrapWidth=800)
+        _TEXT_CACHE[key] = stim
+    stim.text = text
+    return stim
+
+
+# Reset at every instruction screen by `wait_for_advance`
+_screen_clock = core.Clock()
+
+
+def wait_for_advance(screen_name, key_list=("space", "escape", "5")):
+    """
+    Block until one of `key_list` is pressed on an instruction screen.
+
+    Call straight after the screen's ``win.flip()``. Key presses left over
+    from the previous block are discarded first so they cannot skip the
+    screen, and the time spent on the screen is logged from the key
+    timestamp.
+
+    Parameters
+    ----------
+    screen_name : str
+        Label used in the log message.
+    key_list : Sequence[str], optional
+        Keys that end the wait. Default is Space, Escape and the skip key.
+
+    Returns
+    -------
+    List[str]
+        Names of the pressed keys.
+    """
+    event.clearEvents(eventType="keyboard")
+    _screen_clock.reset()
+    keys = event.waitKeys(keyList=list(key_list), timeStamped=_screen_clock)
+    names = [k[0] if isinstance(k, (list, tuple)) else k for k in keys]
+    if keys and isinstance(keys[0], (list, tuple)):
+        logging.debug(
+            f"{screen_name} dismissed with '{names[0]}' after {keys[0][1]:.2f}s"
+        )
+    return names
+
+
+def show_countdown_screen(win, text, duration, timer_stim, keys=()):
+    """
+    Show a text screen with a seconds countdown until it times out or a key.
+
+    The message and countdown stims are built once for the whole screen and
+    the window is only redrawn and flipped when the displayed second changes.
+    Keys are polled every 20 ms in between, and the flips skip PsychoPy's
+    wait for the GPU to finish (the swap still follows the refresh). Escape
+    always quits.
+
+    Parameters
+    ----------
+    win : psychopy.visual.Window
+        PsychoPy window.
+    text : str
+        Message shown for the whole countdown.
+    duration : float
+        Countdown length in seconds.
+    timer_stim : psychopy.visual.TextStim
+        Stim that shows the remaining time (its position and size are kept).
+    keys : Sequence[str], optional
+        Keys that end the screen early. Default is none.
+
+    Returns
+    -------
+    Optional[str]
+        The key that ended the screen, or None if the countdown ran out.
+    """
+    text_stim = visual.TextStim(win, text=text, height=24, color="white", wrapWidth=900)
+    wait_keys = [*keys, "escape"]
+    shown_seconds = None
+
+    clock = core.Clock()
+    get_time, get_keys, flip = clock.getTime, event.getKeys, win.flip
+    event.clearEvents()
+    with no_vsync(win):
+        while True:
+            time_left = duration - get_time()
+            if time_left <= 0:
+                return None
+            if int(time_left) != shown_seconds:
+                shown_seconds = int(time_left)
+                timer_stim.text = get_text("timer_remaining", seconds=shown_seconds)
+                text_stim.draw()
+                timer_stim.draw()
+                flip()
+            else:
+                core.wait(0.02, hogCPUperiod=0)
+
+            pressed = get_keys(keyList=wait_keys)
+            if pressed:
+                if pressed[0] == "escape":
+                    core.quit()
+                return pressed[0]
+
+
 def show_overall_welcome_screen(win, duration=90):
     """
     Display the experiment welcome screen and wait for Space.
@@ -721,23 +1018,36 @@ def show_welcome_screen(win, task_name, n_back_level=None):
     welcome_text += get_text("induction_task_advance_prompt")
 
     timer_stim = visual.TextStim(win, text="", color="white", height=18, pos=(0, -300))
+    show_countdown_screen(win, welcome_text, 20, timer_stim, keys=["space"])
 
-    total_duration = 20
-    clock = core.Clock()
 
-    while clock.getTime() < total_duration:
-        time_left = int(total_duration - clock.getTime())
-        timer_stim.text = get_text("timer_remaining", seconds=time_left)
+# Tasks whose welcome screen has been shown this session
+_WELCOMED = set()
 
-        pressed = show_text_screen(
-            win,
-            welcome_text,
-            keys=["space"],
-            duration=0.1,
-            overlay_stimuli=[timer_stim],
-        )
-        if pressed == "space":
-            break
+
+def show_welcome_once(win, task_name, n_back_level=None):
+    """
+    Show a task's welcome screen the first time the task is reached.
+
+    Parameters
+    ----------
+    win : psychopy.visual.Window
+        PsychoPy window.
+    task_name : str
+        Task label, as for `show_welcome_screen`.
+    n_back_level : int, optional
+        Included in the text for the Sequential task.
+
+    Returns
+    -------
+    bool
+        True if the screen was shown, False if it had been shown already.
+    """
+    if task_name in _WELCOMED:
+        return False
+    show_welcome_screen(win, task_name, n_back_level)
+    _WELCOMED.add(task_name)
+    return True
 
 
 def show_break_screen(win, duration):
@@ -753,14 +1063,7 @@ def show_break_screen(win, duration):
     """
     break_text_base = get_text("induction_break_screen", duration=duration)
     timer_stim = visual.TextStim(win, text="", pos=(0, -100), height=24, color="white")
-
-    timer = core.CountdownTimer(duration)
-    while timer.getTime() > 0:
-        timer_stim.text = get_text("timer_remaining", seconds=int(timer.getTime()))
-
-        show_text_screen(
-            win, break_text_base, duration=0.1, keys=[], overlay_stimuli=[timer_stim]
-        )
+    show_countdown_screen(win, break_text_base, duration, timer_stim)
 
 
 def show_transition_screen(win, next_task_name):
@@ -825,6 +1128,55 @@ def show_level_change_screen(
     show_text_screen(win, message, keys=["space"], duration=10.0)
 
 
+def _subjective_measure_stims(win):
+    """Return the four cached Likert question stims, building them if needed."""
+    prompt = get_text("induction_subjective_prompt")
+    return [
+        get_stim(
+            win, f"subjective_q{q}", get_text(f"induction_subjective_q{q}") + prompt
+        )
+        for q in range(1, 5)
+    ]
+
+
+def prewarm_subjective_measures(win):
+    """
+    Build and render the subjective-measure screens ahead of their first use.
+
+    Drawing each question once uploads its glyph texture, so the first
+    measures screen does not stall. The back buffer is cleared afterwards,
+    so nothing appears on the next flip. Call this while the participant is
+    reading a static screen (e.g. before ``event.waitKeys``).
+
+    Parameters
+    ----------
+    win : psychopy.visual.Window
+        PsychoPy window.
+    """
+    for stim in _subjective_measure_stims(win):
+        stim.draw()
+    win.clearBuffer()
+
+
+def prewarm_image_textures(win):
+    """
+    Upload every preloaded image texture to the GPU before the first block.
+
+    ``ImageStim`` defers its texture upload until the first ``draw()``, which
+    otherwise stalls the first trials that show each picture. Each stim is
+    drawn once and the back buffer is then cleared, so nothing is shown.
+
+    Parameters
+    ----------
+    win : psychopy.visual.Window
+        PsychoPy window.
+    """
+    for stims in (preloaded_images_sequential, preloaded_images_dual):
+        for stim in stims.values():
+            stim.draw()
+    win.clearBuffer()
+
+
 def collect_subjective_measures(win):
     """
     Administer four 1–8 Likert items: fatigue, effort, mind-wandering, overwhelmed.
@@ -840,32 +1192,17 @@ def collect_subjective_measures(win):
         Four integer responses in order:
         [Mental Fatigue, Task Effort, Mind Wandering, Overwhelmed].
     """
-    questions = [
-        get_text("induction_subjective_q1"),
-        get_text("induction_subjective_q2"),
-        get_text("induction_subjective_q3"),
-        get_text("induction_subjective_q4"),
-    ]
     responses = []
+    rating_keys = ["1", "2", "3", "4", "5", "6", "7", "8", "escape"]
 
-    for question in questions:
-        instruction_text = question + get_text("induction_subjective_prompt")
-        instruction_stim = visual.TextStim(
-            win, text=instruction_text, height=24, wrapWidth=800
-        )
-
-        response = None
-        while response is None:
-            instruction_stim.draw()
-            win.flip()
-            keys = event.getKeys(
-                keyList=["1", "2", "3", "4", "5", "6", "7", "8", "escape"]
-            )
-            if keys:
-                if "escape" in keys:
-                    core.quit()
-                response = int(keys[0])
-        responses.append(response)
+    for instruction_stim in _subjective_measure_stims(win):
+        # The question is static, so flip it once and block until a rating
+        instruction_stim.draw()
+        win.flip()
+        keys = event.waitKeys(keyList=rating_keys)
+        if "escape" in keys:
+            core.quit()
+        responses.append(int(keys[0]))
 
     return responses
 
@@ -875,7 +1212,39 @@ def collect_subjective_measures(win):
 # =============================================================================
 
 
+# (task_name, block_number) -> (presentation_s, isi_s); cleared per session
+_TIMING_LUT = {}
+
+
 def get_progressive_timings(task_name, block_number):
+    """
+    Return block-dependent presentation and ISI durations.
+
+    Each (task, block) pair is computed once per session and then served
+    from `_TIMING_LUT`, so repeated calls do not re-read the GUI config.
+
+    Parameters
+    ----------
+    task_name : str
+        "Spatial N-back" or "Dual N-back" (others yield no change).
+    block_number : int
+        Zero-based block index (cumulative across the task).
+
+    Returns
+    -------
+    Tuple[float, float]
+        (presentation_time_s, isi_time_s) after applying per-block reductions.
+    """
+    key = (task_name, block_number)
+    timings = _TIMING_LUT.get(key)
+    if timings is None:
+        timings = _TIMING_LUT[key] = _compute_progressive_timings(
+            task_name, block_number
+        )
+    return timings
+
+
+def _compute_progressive_timings(task_name, block_number):
     """
     Compute block-dependent presentation and ISI durations.
 
@@ -895,8 +1264,6 @@ def get_progressive_timings(task_name, block_number):
         (presentation_time_s, isi_time_s) after applying per-block reductions.
     """
     # Try to get base timings from GUI config
-    from wand_nback.common import load_gui_config
-
     gui_config = load_gui_config()
 
     if task_name == "Spatial N-back":
@@ -1016,8 +1383,201 @@ def adjust_nback_level(
         return current_level
 
 
+def sample_distractor_trials(earliest, latest, count, min_gap):
+    """
+    Draw distractor trial numbers with a guaranteed minimum spacing.
+
+    Uses the gap transform: ``k`` sorted values are sampled from a range
+    shortened by ``(k - 1) * (min_gap - 1)`` and each is shifted by its rank
+    times ``min_gap - 1``. Every spacing-valid placement is equally likely and
+    no rejection loop is needed.
+
+    Parameters
+    ----------
+    earliest, latest : int
+        Inclusive range of eligible (1-based) trial numbers.
+    count : int
+        Desired number of distractors.
+    min_gap : int
+        Minimum distance between consecutive distractor trials.
+
+    Returns
+    -------
+    list of int
+        Sorted trial numbers. Shorter than ``count`` only when the range cannot
+        hold that many distractors at ``min_gap`` spacing.
+    """
+    span = latest - earliest + 1
+    if span < 1 or count < 1:
+        return []
+    k = min(count, (span - 1) // min_gap + 1)
+    reduced_span = span - (k - 1) * (min_gap - 1)
+    picks = np.sort(RNG.choice(reduced_span, k, replace=False))
+    picks += np.arange(k) * (min_gap - 1) + earliest
+    return picks.tolist()
+
+
+def sample_jitter(base_seconds, n_trials):
+    """
+    Draw the jittered durations for a whole block in one call.
+
+    Draws from `JITTER_RNG` via ``common.get_jitter_array``: each value is
+    uniform within ``timing.jitter_fraction`` of the base duration.
+
+    Parameters
+    ----------
+    base_seconds : float
+        The nominal duration in seconds.
+    n_trials : int
+        Number of durations to draw.
+
+    Returns
+    -------
+    list of float
+        One jittered duration per trial.
+    """
+    return get_jitter_array(base_seconds, n_trials, JITTER_RNG).tolist()
+
+
+# Per-trial outcome codes used by the spatial and dual blocks
+OUTCOME_UNSCORED = -2
+OUTCOME_LAPSE = -1
+OUTCOME_INCORRECT = 0
+OUTCOME_CORRECT = 1
+
+
+def summarise_outcomes(outcomes):
+    """
+    Reduce per-trial outcome codes to block accuracy, lapses and scored trials.
+
+    Parameters
+    ----------
+    outcomes : numpy.ndarray
+        ``int8`` array of ``OUTCOME_*`` codes, one per trial. Trials that were
+        not scored or not reached keep ``OUTCOME_UNSCORED``.
+
+    Returns
+    -------
+    Tuple[float, int, int]
+        ``(accuracy_percent, lapses, total_responses)`` where lapses count as
+        scored trials.
+    """
+    counts = np.bincount(outcomes[outcomes != OUTCOME_UNSCORED] + 1, minlength=3)
+    lapses, incorrect, correct = (int(c) for c in counts[:3])
+    total_responses = correct + incorrect + lapses
+    accuracy = (correct / total_responses) * 100 if total_responses > 0 else 0
+    return accuracy, lapses, total_responses
+
+
+_frame_rate = None
+
+
+def get_frame_rate(win, fallback=60.0):
+    """
+    Return the measured refresh rate of ``win`` in Hz, measuring it only once.
+
+    Parameters
+    ----------
+    win : psychopy.visual.Window
+        Active PsychoPy window.
+    fallback : float, optional
+        Rate assumed when PsychoPy cannot measure the display. Default 60.0.
+
+    Returns
+    -------
+    float
+        Refresh rate used to convert durations into frame counts.
+    """
+    global _frame_rate
+    if _frame_rate is None:
+        measured = win.getActualFrameRate()
+        if isinstance(measured, (int, float)) and measured > 0:
+            _frame_rate = float(measured)
+        else:
+            _frame_rate = float(fallback)
+        logging.info(f"Frame rate for scheduling: {_frame_rate:.2f} Hz")
+    return _frame_rate
+
+
+def present_for_frames(win, draw, n_frames):
+    """
+    Keep a stimulus on screen for exactly ``n_frames`` refreshes.
+
+    Presentation time is quantised to whole frames instead of relying on
+    ``core.wait`` sleep resolution. With an FBO-backed window the first frame is
+    drawn once and re-presented by flipping without clearing; otherwise
+    ``draw`` is called before every flip. The final flip always clears so the
+    next screen starts from a blank buffer.
+
+    Parameters
+    ----------
+    win : psychopy.visual.Window
+        PsychoPy window.
+    draw : Callable[[], None]
+        Draws the full stimulus frame (without flipping).
+    n_frames : int
+        Number of refreshes to show the stimulus for (at least 1).
+
+    Returns
+    -------
+    None
+    """
+    n_frames = max(1, int(n_frames))
+    retain = bool(getattr(win, "useFBO", False))
+    flip = win.flip
+    for frame in range(n_frames):
+        if frame == 0 or not retain:
+            draw()
+        flip(clearBuffer=(not retain) or frame == n_frames - 1)
+
+
+def frame_locked_duration(seconds, frame_rate, flip_each_frame=False):
+    """
+    Return how long to wait on a static screen so it lasts whole frames.
+
+    A screen that is followed by a flip stays up until the first refresh after
+    the wait ends. Ending the wait half a frame before the refresh nearest
+    ``seconds`` lets that flip land on it, so the screen lasts a whole number
+    of frames without being redrawn every refresh. This assumes the wait
+    returns within half a refresh of its deadline, which
+    ``collect_trial_response`` guarantees by polling without sleeping for its
+    last few frames.
+
+    When the wait itself flips every frame (``collect_trial_response`` with a
+    ``draw_callback``), its last pass already blocks until a refresh, so the
+    wait ends a further frame early: the screen then gets ``N - 1`` redraw
+    flips and the next screen's flip lands on refresh ``N``.
+
+    Parameters
+    ----------
+    seconds : float
+        Intended duration of the screen.
+    frame_rate : float
+        Refresh rate of the window in Hz.
+    flip_each_frame : bool, optional
+        True if the wait loop flips on every pass. Default False.
+
+    Returns
+    -------
+    float
+        Seconds to wait after the screen's flip before the next flip.
+    """
+    n_frames = max(1, round(seconds * frame_rate))
+    if flip_each_frame:
+        return max(0.0, (n_frames - 1.5) / frame_rate)
+    return (n_frames - 0.5) / frame_rate
+
+
+_image_feedback_stim = None
+
+
 def display_image(
-    win, image_file, level_indicator, feedback_text=None, task="sequential"
+    win,
+    image_file,
+    level_indicator,
+    feedback_text=None,
+    task="sequential",
+    background=None,
 ):
     """
     Draw background grid, level text, and a central image; optional feedback.
@@ -1034,6 +1594,9 @@ def display_image(
         Short message drawn above the image if provided. Default None.
     task : {"sequential","dual"}
         Selects the preloaded image dictionary and default image size.
+    background : psychopy.visual.BufferImageStim, optional
+        Pre-rendered grid and level indicator. When given it is drawn in
+        place of ``draw_grid()`` and ``level_indicator``. Default None.
 
     Returns
     -------
@@ -1054,26 +1617,255 @@ def display_image(
     image_stim.pos = (0, 0)  # Always center for sequential
 
     # Draw the grid and level indicator first
-    draw_grid()
-    level_indicator.draw()
+    if background is not None:
+        background.draw()
+    else:
+        draw_grid()
+        level_indicator.draw()
 
     # Draw the main image
     image_stim.draw()
 
     # Optionally, draw feedback text
     if feedback_text:
-        feedback_message = visual.TextStim(
+        # One TextStim is kept for the session; text and position are updated
+        global _image_feedback_stim
+        feedback_pos = (0, image_stim.size[1] / 2 + 50)
+        if _image_feedback_stim is None:
+            _image_feedback_stim = visual.TextStim(
+                win,
+                text=feedback_text,
+                color="orange",
+                height=24,
+                pos=feedback_pos,
+                units="pix",
+            )
+        else:
+            if _image_feedback_stim.text != feedback_text:
+                _image_feedback_stim.text = feedback_text
+            _image_feedback_stim.pos = feedback_pos
+        _image_feedback_stim.draw()
+
+    # Flip the display
+    win.flip()
+
+
+_fixation_cross = None
+
+
+def get_fixation_cross(win):
+    """Return the shared central fixation cross, building it on first use."""
+    global _fixation_cross
+    if _fixation_cross is None or _fixation_cross.win is not win:
+        _fixation_cross = visual.TextStim(
+            win, text="+", color="white", height=32, units="pix", pos=(0, 0)
+        )
+    return _fixation_cross
+
+
+# Dual block level labels per N-back level
+_dual_level_texts = {}
+
+
+def get_dual_level_text(win, n):
+    """Return the cached top-left "Level" label used by Dual blocks at level n."""
+    level_text = _dual_level_texts.get(n)
+    if level_text is None or level_text.win is not win:
+        level_text = _dual_level_texts[n] = visual.TextStim(
             win,
-            text=feedback_text,
-            color="orange",
+            text=get_text("level_label", n=n),
+            color="white",
             height=24,
-            pos=(0, image_stim.size[1] / 2 + 50),
-            units="pix",
+            pos=(-450, 350),
         )
-        feedback_message.draw()
+    return level_text
 
-    # Flip the display
-    win.flip()
+
+# Dual block trial stims, built once per window: (highlight, lapse_feedback)
+_dual_trial_stims = None
+
+
+def get_dual_trial_stims(win):
+    """
+    Return the Dual block's shared highlight rect and lapse message.
+
+    Both are moved or recoloured in place by the block instead of being
+    rebuilt on every trial.
+
+    Parameters
+    ----------
+    win : psychopy.visual.Window
+        PsychoPy window.
+
+    Returns
+    -------
+    Tuple[psychopy.visual.Rect, psychopy.visual.TextStim]
+        The cell highlight (one 480 px grid cell wide) and the orange lapse
+        feedback text.
+    """
+    global _dual_trial_stims
+    if _dual_trial_stims is None or _dual_trial_stims[0].win is not win:
+        cell_len = 480 / 3
+        _dual_trial_stims = (
+            visual.Rect(win, width=cell_len, height=cell_len, lineWidth=2),
+            visual.TextStim(win, text="", color="orange", height=24, pos=(0, 400)),
+        )
+    return _dual_trial_stims
+
+
+def make_distractor_isi_frame(
+    win, scenery, distractor_rect, isi_seconds, frame_rate, trial_number
+):
+    """
+    Return a per-frame draw callback for an ISI with a distractor flash.
+
+    The 200 ms flash is scheduled in refreshes, centred on the ISI midpoint.
+    Refreshes are counted from the ISI onset flip (refresh 0), which happens
+    before the callback's first call, so the first flip it draws for is
+    refresh 1. Onset/offset triggers are queued for the flip that shows or
+    removes the flash.
+
+    Parameters
+    ----------
+    win : psychopy.visual.Window
+        PsychoPy window.
+    scenery : Sequence
+        Stimuli drawn on every ISI frame (background, fixation cross).
+    distractor_rect : psychopy.visual.Rect
+        The distractor flash.
+    isi_seconds : float
+        Duration of this ISI.
+    frame_rate : float
+        Refresh rate of the window in Hz.
+    trial_number : int
+        1-based trial number, for the log.
+
+    Returns
+    -------
+    Callable[[], None]
+        Draws one ISI frame; pass as ``draw_callback`` to
+        ``collect_trial_response``.
+    """
+    onset = max(1, round((isi_seconds / 2 - 0.1) * frame_rate))
+    offset = onset + round(0.2 * frame_rate)
+    refresh = 1
+
+    def draw_frame():
+        nonlocal refresh
+        for stim in scenery:
+            stim.draw()
+        if onset <= refresh < offset:
+            distractor_rect.draw()
+        if refresh == onset:
+            win.callOnFlip(send_trigger, "distractor_onset")
+            logging.info(f"Distractor @ trial {trial_number}")
+        elif refresh == offset:
+            win.callOnFlip(send_trigger, "distractor_offset")
+        refresh += 1
+
+    return draw_frame
+
+
+# Sequential block scenery per N-back level: (level_indicator, background)
+_sequential_scenery = {}
+
+
+def get_sequential_scenery(win, n):
+    """
+    Return the level label and pre-rendered grid background for a level.
+
+    The first Sequential block at a level builds both. Later blocks at that
+    level reuse them, so they skip the GPU read-back of
+    `visual.BufferImageStim`.
+
+    Parameters
+    ----------
+    win : psychopy.visual.Window
+        PsychoPy window.
+    n : int
+        N-back level shown in the label.
+
+    Returns
+    -------
+    Tuple[psychopy.visual.TextStim, psychopy.visual.BufferImageStim]
+        The level indicator and the grid-plus-label snapshot.
+    """
+    cached = _sequential_scenery.get(n)
+    if cached is not None and cached[0].win is win:
+        return cached
+
+    margin_x, margin_y = 350, 150
+    level_indicator = visual.TextStim(
+        win,
+        text=get_text("level_label", n=n),
+        color="white",
+        height=32,
+        pos=(-win.size[0] // 2 + margin_x, win.size[1] // 2 - margin_y),
+        units="pix",
+        alignText="left",
+    )
+    # Grid and level label are static for the block: render them once and
+    # draw the snapshot as a single textured quad on every frame
+    static_background = visual.BufferImageStim(win, stim=[*grid_lines, level_indicator])
+    # The capture leaves the scenery in the back buffer; the next frame may
+    # not start by drawing it
+    win.clearBuffer()
+    _sequential_scenery[n] = (level_indicator, static_background)
+    return level_indicator, static_background
+
+
+# Dual block scenery per N-back level: grid, level label and fixation snapshot
+_dual_scenery = {}
+
+
+def get_dual_scenery(win, n):
+    """
+    Return the pre-rendered static Dual frame for an N-back level.
+
+    The background grid, the level-coloured 3x3 cells and outline, the level
+    label and the fixation cross do not change within a block. They are
+    rendered once into a `visual.BufferImageStim`, so each Dual frame draws
+    them as a single textured quad. Later blocks at the same level reuse it.
+
+    Parameters
+    ----------
+    win : psychopy.visual.Window
+        PsychoPy window.
+    n : int
+        N-back level, which sets the cell colour and the label.
+
+    Returns
+    -------
+    psychopy.visual.BufferImageStim
+        Snapshot of everything a Dual frame shows except the trial stimulus.
+    """
+    cached = _dual_scenery.get(n)
+    if cached is not None and cached.win is win:
+        return cached
+
+    level_color = get_level_color(n)
+    cells, outline = create_grid(win, 3)
+    for rect in cells:
+        rect.lineColor = level_color
+    outline.lineColor = level_color
+    background = visual.BufferImageStim(
+        win,
+        stim=[
+            *grid_lines,
+            *cells,
+            outline,
+            get_dual_level_text(win, n),
+            get_fixation_cross(win),
+        ],
+    )
+    # The capture leaves the scenery in the back buffer; the next frame may
+    # not start by drawing it
+    win.clearBuffer()
+    _dual_scenery[n] = background
+    return background
+
+
+_spatial_feedback_stim = None
 
 
 def display_spatial_stimulus(win, n_level, highlight_pos=None, feedback_text=None):
@@ -1102,15 +1894,21 @@ def display_spatial_stimulus(win, n_level, highlight_pos=None, feedback_text=Non
         n_level=n_level,
     )
     if feedback_text:
-        feedback_stim = visual.TextStim(
-            win, text=feedback_text, color="orange", height=24, pos=(0, 300)
-        )
-        feedback_stim.draw()
+        # One TextStim is kept for the session; only its text is updated
+        global _spatial_feedback_stim
+        if _spatial_feedback_stim is None:
+            _spatial_feedback_stim = visual.TextStim(
+                win, text=feedback_text, color="orange", height=24, pos=(0, 300)
+            )
+        elif _spatial_feedback_stim.text != feedback_text:
+            _spatial_feedback_stim.text = feedback_text
+        _spatial_feedback_stim.draw()
 
 
 # =============================================================================
 #  SECTION 7: CORE TASK BLOCKS
 # =============================================================================
+@gc_paused()
 def run_sequential_nback_block(
     win,
     n,
@@ -1158,7 +1956,7 @@ def run_sequential_nback_block(
         'Reaction Times', 'Detailed Data',
         'Pre-Distractor Accuracy', 'Pre-Distractor Avg RT', 'Pre-Distractor A-Prime',
         'Post-Distractor Accuracy', 'Post-Distractor Avg RT', 'Post-Distractor A-Prime',
-        'Overall D-Prime'.
+        'Overall D-Prime'. 'Detailed Data' is a `trial_dtype` structured array.
     """
     skip_responses = n
 
@@ -1177,27 +1975,19 @@ def run_sequential_nback_block(
 
     total_trials = num_trials if num_trials is not None else len(images)
 
-    nback_queue = []
-    detailed_data = []
-    correct_responses = 0
-    incorrect_responses = 0
-    lapses = 0
-    total_reaction_time = 0
-    reaction_times = []
+    # One row per scored trial, written in place; trimmed to n_logged at the end.
+    # The Image column is sized to the longest name so none is truncated.
+    detailed_data = np.empty(
+        total_trials, dtype=trial_dtype(max(map(len, images), default=0))
+    )
+    n_logged = 0
     last_lapse = False
 
-    fixation_cross = visual.TextStim(
-        win, text="+", color="white", height=32, units="pix", pos=(0, 0)
-    )
-    margin_x, margin_y = 350, 150
-    level_indicator = visual.TextStim(
-        win,
-        text=get_text("level_label", n=n),
-        color="white",
-        height=32,
-        pos=(-win.size[0] // 2 + margin_x, win.size[1] // 2 - margin_y),
-        units="pix",
-        alignText="left",
+    fixation_cross = get_fixation_cross(win)
+    level_indicator, static_background = get_sequential_scenery(win, n)
+    frame_rate = get_frame_rate(win)
+    distractor_rect = visual.Rect(
+        win, width=100, height=100, fillColor="white", units="pix"
     )
 
     DISTRACTORS_PER_BLOCK = 13
@@ -1207,17 +1997,12 @@ def run_sequential_nback_block(
     LATEST_DISTRACTOR = total_trials - 3
 
     if DISTRACTORS_ENABLED and LATEST_DISTRACTOR - EARLIEST_DISTRACTOR + 1 >= 1:
-        candidate_trials = list(range(EARLIEST_DISTRACTOR, LATEST_DISTRACTOR + 1))
-        random.shuffle(candidate_trials)
-
-        distractor_trials = []
-        for t in candidate_trials:
-            if all(abs(t - prev) >= MIN_GAP_BETWEEN for prev in distractor_trials):
-                distractor_trials.append(t)
-                if len(distractor_trials) == DISTRACTORS_PER_BLOCK:
-                    break
-
-        distractor_trials.sort()
+        distractor_trials = sample_distractor_trials(
+            EARLIEST_DISTRACTOR,
+            LATEST_DISTRACTOR,
+            DISTRACTORS_PER_BLOCK,
+            MIN_GAP_BETWEEN,
+        )
         if len(distractor_trials) < DISTRACTORS_PER_BLOCK:
             logging.warning(
                 f"Block {block_number}: could only place "
@@ -1230,18 +2015,27 @@ def run_sequential_nback_block(
     else:
         distractor_trials = []
         logging.info(f"Block {block_number}: Distractors disabled")
+    # Indexed by 1-based trial number: non-zero where a distractor is scheduled
+    is_distractor = bytearray(total_trials + 2)
+    for trial_number in distractor_trials:
+        is_distractor[trial_number] = 1
+    lapse_text = get_text("lapse_feedback")
+    response_map = get_response_map("label")
+    # Reset on each stimulus flip; reaction times are measured from it
+    onset_clock = core.Clock()
 
     if is_first_encounter:
         msg = get_text("no_response_needed", n=n)
         feedback_text = visual.TextStim(
             win, text=msg, color="white", height=24, units="pix"
         )
-        draw_grid()
-        level_indicator.draw()
+        static_background.draw()
         feedback_text.draw()
         win.flip()
         core.wait(2)
 
+    isi_jitter = sample_jitter(isi, total_trials)
+
     for i in range(total_trials):
         # Check for skip request (press 5)
         if "5" in event.getKeys(keyList=["5"]):
@@ -1253,108 +2047,94 @@ def run_sequential_nback_block(
             break
 
         img = images[i]
+        is_target = i >= n and img == images[i - n]
         feedback_text = None
         if last_lapse and i >= skip_responses:
-            feedback_text = get_text("lapse_feedback")
+            feedback_text = lapse_text
             last_lapse = False
 
-        display_image(win, img, level_indicator, feedback_text=feedback_text)
-        send_trigger("sequential_stimulus_onset")
+        # Trigger and onset clock fire at the flip itself, not after it returns
+        win.callOnFlip(onset_clock.reset)
+        win.callOnFlip(send_trigger, "sequential_stimulus_onset")
+        display_image(
+            win,
+            img,
+            level_indicator,
+            feedback_text=feedback_text,
+            background=static_background,
+        )
 
+        display_start = onset_clock.getTime()
         resp1, rt1 = collect_trial_response(
             win,
-            duration=display_duration,
-            response_map=get_response_map("label"),
+            duration=frame_locked_duration(display_duration, frame_rate),
+            response_map=response_map,
             is_valid_trial=(i >= skip_responses),
             stop_on_response=False,
         )
 
-        send_trigger("sequential_stimulus_offset")
-
-        draw_grid()
+        static_background.draw()
         fixation_cross.draw()
-        level_indicator.draw()
+        win.callOnFlip(send_trigger, "sequential_stimulus_offset")
         win.flip()
 
-        jittered_isi = get_jitter(isi)
-        distractor_displayed = False
-
-        def seq_distractor_tick(t):
-            nonlocal distractor_displayed
-            if (
-                (i + 1) in distractor_trials
-                and not distractor_displayed
-                and t >= jittered_isi / 2 - 0.1
-            ):
-                draw_grid()
-                fixation_cross.draw()
-                level_indicator.draw()
-                visual.Rect(
-                    win, width=100, height=100, fillColor="white", units="pix"
-                ).draw()
-                win.flip()
-                core.wait(0.2)
-                draw_grid()
-                fixation_cross.draw()
-                level_indicator.draw()
-                win.flip()
-                distractor_displayed = True
-                logging.info(f"Distractor @ trial {i + 1}")
+        jittered_isi = isi_jitter[i]
+        trial_has_distractor = is_distractor[i + 1]
+        isi_frame_callback = None
+
+        if trial_has_distractor:
+            isi_frame_callback = make_distractor_isi_frame(
+                win,
+                (static_background, fixation_cross),
+                distractor_rect,
+                jittered_isi,
+                frame_rate,
+                trial_number=i + 1,
+            )
 
+        isi_start = onset_clock.getTime()
         resp2, rt2 = collect_trial_response(
             win,
-            duration=jittered_isi,
-            response_map=get_response_map("label"),
+            duration=frame_locked_duration(
+                jittered_isi, frame_rate, flip_each_frame=isi_frame_callback is not None
+            ),
+            response_map=response_map,
             is_valid_trial=(i >= skip_responses),
             stop_on_response=False,
-            tick_callback=seq_distractor_tick,
+            draw_callback=isi_frame_callback,
         )
 
-        final_response = resp1 if resp1 else resp2
-        final_rt = rt1 if resp1 else (display_duration + rt2 if rt2 else None)
+        # A response during the image wins; both are timed from the onset flip
+        if resp1:
+            final_response, final_rt = resp1, display_start + rt1
+        elif resp2:
+            final_response, final_rt = resp2, isi_start + rt2
+        else:
+            final_response, final_rt = None, None
 
         if final_response is not None:
-            is_target = len(nback_queue) >= n and img == nback_queue[-n]
             user_said_match = final_response == "match"
             is_correct = user_said_match == is_target
 
-            correct_responses += int(is_correct)
-            incorrect_responses += int(not is_correct)
-            total_reaction_time += final_rt
-            reaction_times.append(final_rt)
-            detailed_data.append(
-                {
-                    "Trial": i + 1,
-                    "Image": img,
-                    "Is Target": is_target,
-                    "Response": final_response,
-                    "Reaction Time": final_rt,
-                    "Accuracy": is_correct,
-                }
+            detailed_data[n_logged] = (
+                i + 1,
+                img,
+                is_target,
+                Resp.from_label(final_response),
+                final_rt,
+                is_correct,
             )
+            n_logged += 1
         elif i >= skip_responses:
-            lapses += 1
             last_lapse = True
-            is_target = len(nback_queue) >= n and img == nback_queue[-n]
-            detailed_data.append(
-                {
-                    "Trial": i + 1,
-                    "Image": img,
-                    "Is Target": is_target,
-                    "Response": "lapse",
-                    "Reaction Time": None,
-                    "Accuracy": False,
-                }
-            )
+            detailed_data[n_logged] = (i + 1, img, is_target, Resp.LAPSE, np.nan, False)
+            n_logged += 1
 
-        nback_queue.append(img)
-        if len(nback_queue) > n:
-            nback_queue.pop(0)
-        event.clearEvents()
+        event.clearEvents(eventType="keyboard")
 
         # All behavioural metrics are now computed in wand_analysis.summarise_sequential_block
     return summarise_sequential_block(
-        detailed_data=detailed_data,
+        detailed_data=detailed_data[:n_logged],
         distractor_trials=distractor_trials,
         block_number=block_number,
     )
@@ -1388,6 +2168,11 @@ def run_spatial_nback_block(
         block_label += f".{sub_block_index + 1}"
 
     positions = generate_positions_with_matches(num_trials, n)
+    # Targets are fixed by the generated sequence: resolve them all up front
+    pos_arr = np.asarray(positions)
+    is_target_seq = np.zeros(len(pos_arr), dtype=bool)
+    is_target_seq[n:] = pos_arr[n:] == pos_arr[:-n]
+    is_target_seq = is_target_seq.tolist()
     logging.info(
         f"Spatial Block {block_label} timings - Presentation: {display_duration * 1000}ms, ISI: {isi * 1000}ms"
     )
@@ -1397,14 +2182,12 @@ def run_spatial_nback_block(
     skip_to_next_block = False
     event.clearEvents()
 
-    nback_queue = []
-    correct_responses = 0
-    incorrect_responses = 0
-    lapses = 0
-    total_reaction_time = 0
-    reaction_times = []
-    responses = []
+    # Per-trial outcome codes, reduced with NumPy once the block ends
+    outcomes = np.full(len(positions), OUTCOME_UNSCORED, dtype=np.int8)
     last_lapse = False
+    lapse_text = get_text("lapse_feedback")
+    response_map = get_response_map("bool")
+    frame_rate = get_frame_rate(win)
 
     if is_first_encounter:
         initial_feedback = get_text("no_response_needed", n=n)
@@ -1417,6 +2200,9 @@ def run_spatial_nback_block(
         win.flip()
         core.wait(0.5)
 
+    display_jitter = sample_jitter(display_duration, len(positions))
+    isi_jitter = sample_jitter(isi, len(positions))
+
     for i, pos in enumerate(positions):
         # Check for skip request (press 5)
         if "5" in event.getKeys(keyList=["5"]):
@@ -1429,50 +2215,43 @@ def run_spatial_nback_block(
 
         feedback_text = None
         if last_lapse:
-            feedback_text = get_text("lapse_feedback")
+            feedback_text = lapse_text
             last_lapse = False
 
-        is_target = len(nback_queue) >= n and pos == nback_queue[0]
+        is_target = is_target_seq[i]
+        this_display = display_jitter[i]
+        this_isi = isi_jitter[i]
 
-        display_spatial_stimulus(win, n, highlight_pos=pos, feedback_text=feedback_text)
-        win.flip()
-        core.wait(get_jitter(display_duration))
+        present_for_frames(
+            win,
+            lambda: display_spatial_stimulus(
+                win, n, highlight_pos=pos, feedback_text=feedback_text
+            ),
+            round(this_display * frame_rate),
+        )
 
         display_spatial_stimulus(win, n)
         win.flip()
 
         response, reaction_time = collect_trial_response(
             win,
-            duration=get_jitter(isi),
-            response_map=get_response_map("bool"),
+            duration=frame_locked_duration(this_isi, frame_rate),
+            response_map=response_map,
             is_valid_trial=(i >= n),
             stop_on_response=False,
         )
 
         if response is not None:
-            if response == is_target:
-                correct_responses += 1
-            else:
-                incorrect_responses += 1
-
-            total_reaction_time += reaction_time
-            reaction_times.append(reaction_time)
-            responses.append((i + 1, pos, is_target, response, reaction_time))
-
+            outcomes[i] = (
+                OUTCOME_CORRECT if response == is_target else OUTCOME_INCORRECT
+            )
         elif i >= n:
-            lapses += 1
-            responses.append((i + 1, pos, is_target, None, None))
+            outcomes[i] = OUTCOME_LAPSE
             last_lapse = True
 
-        nback_queue.append(pos)
-        if len(nback_queue) > n:
-            nback_queue.pop(0)
-
-        event.clearEvents()
-
-    total_responses = correct_responses + incorrect_responses + lapses
-    accuracy = (correct_responses / total_responses) * 100 if total_responses > 0 else 0
+        event.clearEvents(eventType="keyboard")
 
+    accuracy, lapses, total_responses = summarise_outcomes(outcomes)
     return adjust_nback_level(n, accuracy), lapses, total_responses
 
 
@@ -1522,27 +2301,39 @@ def run_dual_nback_block(
     )
 
     positions, images = generate_dual_nback_sequence(num_trials, 3, n, image_files)
-    nback_queue = []
-    correct_responses = 0
-    incorrect_responses = 0
-    lapses = 0
-    total_reaction_time = 0
-    reaction_times = []
-
-    grid, outline = create_grid(win, 3)
-    fixation_cross = visual.TextStim(win, text="+", color="white", height=32)
-    level_text = visual.TextStim(
-        win,
-        text=get_text("level_label", n=n),
-        color="white",
-        height=24,
-        pos=(-450, 350),
+
+    # Position and image columns of the sequence; a trial is a target when
+    # both match the record n trials back. The image column is sized to the
+    # longest name: truncated names could otherwise compare equal.
+    img_len = max(max(map(len, images), default=0), 1)
+    seq = np.empty(len(positions), dtype=[("pos", "i4", (2,)), ("img", f"U{img_len}")])
+    seq["pos"] = positions
+    seq["img"] = images
+    is_target_seq = np.zeros(len(seq), dtype=bool)
+    is_target_seq[n:] = (seq["pos"][n:] == seq["pos"][:-n]).all(axis=1) & (
+        seq["img"][n:] == seq["img"][:-n]
     )
+    is_target_seq = is_target_seq.tolist()
+
+    # Per-trial outcome codes, reduced with NumPy once the block ends
+    outcomes = np.full(len(positions), OUTCOME_UNSCORED, dtype=np.int8)
+
+    level_color = get_level_color(n)
+    lapse_text = get_text("lapse_feedback")
+    response_map = get_response_map("bool")
+    frame_rate = get_frame_rate(win)
+
+    static_background = get_dual_scenery(win, n)
+    highlight, lapse_feedback_stim = get_dual_trial_stims(win)
+    highlight.lineColor = level_color
+    highlight.fillColor = level_color
+    if lapse_feedback_stim.text != lapse_text:
+        lapse_feedback_stim.text = lapse_text
 
     if is_first_encounter:
         initial_feedback = get_text("no_response_needed", n=n)
         feedback_text = visual.TextStim(
-            win, text=initial_feedback, color=get_level_color(n), height=24, pos=(0, 0)
+            win, text=initial_feedback, color=level_color, height=24, pos=(0, 0)
         )
         feedback_text.draw()
         win.flip()
@@ -1557,6 +2348,9 @@ def run_dual_nback_block(
     skip_to_next_block = False
     event.clearEvents()
 
+    display_jitter = sample_jitter(display_duration, len(positions))
+    isi_jitter = sample_jitter(isi, len(positions))
+
     for i, (pos, img) in enumerate(zip(positions, images)):
         # Check for skip request (press 5)
         if "5" in event.getKeys(keyList=["5"]):
@@ -1567,84 +2361,106 @@ def run_dual_nback_block(
             logging.warning(f"Dual block SKIPPED at trial {i+1}/{num_trials}")
             break
 
-        if last_lapse:
-            lapse_feedback = get_text("lapse_feedback")
-            last_lapse = False
-        else:
-            lapse_feedback = None
+        lapse_feedback = last_lapse
+        last_lapse = False
 
         if i >= num_trials:
             break
 
-        is_target = (
-            len(nback_queue) >= n
-            and pos == nback_queue[-n][0]
-            and img == nback_queue[-n][1]
-        )
-
-        draw_grid()
-        for rect in grid:
-            rect.lineColor = get_level_color(n)
-            rect.draw()
-        outline.lineColor = get_level_color(n)
-        outline.draw()
-        level_text.draw()
-        fixation_cross.draw()
-
-        if lapse_feedback:
-            lapse_feedback_stim = visual.TextStim(
-                win, text=lapse_feedback, color="orange", height=24, pos=(0, 400)
-            )
-            lapse_feedback_stim.draw()
+        is_target = is_target_seq[i]
+        this_display = display_jitter[i]
+        this_isi = isi_jitter[i]
 
-        highlight, image_stim = display_dual_stimulus(
-            win, pos, img, 3, n_level=n, feedback_text=None, return_stims=True
+        _, image_stim = display_dual_stimulus(
+            win,
+            pos,
+            img,
+            3,
+            n_level=n,
+            feedback_text=None,
+            preloaded_images=preloaded_images_dual,
+            return_stims=True,
+            highlight=highlight,
         )
-        highlight.draw()
-        image_stim.draw()
 
-        win.flip()
-        core.wait(get_jitter(display_duration))
+        def draw_stimulus_frame():
+            static_background.draw()
+            if lapse_feedback:
+                lapse_feedback_stim.draw()
+            highlight.draw()
+            image_stim.draw()
 
-        draw_grid()
-        for rect in grid:
-            rect.lineColor = get_level_color(n)
-            rect.draw()
-        outline.lineColor = get_level_color(n)
-        outline.draw()
-        fixation_cross.draw()
-        level_text.draw()
+        present_for_frames(win, draw_stimulus_frame, round(this_display * frame_rate))
+
+        static_background.draw()
         win.flip()
 
         response, reaction_time = collect_trial_response(
             win,
-            duration=get_jitter(isi),
-            response_map=get_response_map("bool"),
+            duration=frame_locked_duration(this_isi, frame_rate),
+            response_map=response_map,
             is_valid_trial=(i >= n),
             stop_on_response=False,
         )
 
         if response is not None:
-            if response == is_target:
-                correct_responses += 1
-            else:
-                incorrect_responses += 1
-            total_reaction_time += reaction_time
-            reaction_times.append(reaction_time)
+            outcomes[i] = (
+                OUTCOME_CORRECT if response == is_target else OUTCOME_INCORRECT
+            )
         elif i >= n:
-            lapses += 1
+            outcomes[i] = OUTCOME_LAPSE
             last_lapse = True
 
-        nback_queue.append((pos, img))
-        if len(nback_queue) > n:
-            nback_queue.pop(0)
+        event.clearEvents(eventType="keyboard")
 
-        event.clearEvents()
+    accuracy, lapses, total_responses = summarise_outcomes(outcomes)
+    return adjust_nback_level(n, accuracy), lapses, total_responses
 
-    total_responses = correct_responses + incorrect_responses + lapses
-    accuracy = (correct_responses / total_responses) * 100 if total_responses > 0 else 0
 
-    return adjust_nback_level(n, accuracy), lapses, total_responses
+def build_adaptive_schedule(
+    task_name, num_blocks, target_duration, starting_block_number=0
+):
+    """
+    Precompute timings and sub-block trial counts for every main block.
+
+    Parameters
+    ----------
+    task_name : str
+        Task label passed to `get_progressive_timings`.
+    num_blocks : int
+        Number of main blocks.
+    target_duration : float
+        Total duration for the whole task (seconds).
+    starting_block_number : int, optional
+        Offset for progressive timing across tasks. Default 0.
+
+    Returns
+    -------
+    List[Tuple[float, float, int]]
+        One ``(display_duration, isi, sub_block_trials)`` entry per main block.
+    """
+    # Each main block is split into 3 equal sub-blocks
+    sub_block_duration = target_duration / num_blocks / 3 if num_blocks else 0.0
+
+    schedule = []
+    for block in range(num_blocks):
+        display_duration, isi = get_progressive_timings(
+            task_name, starting_block_number + block
+        )
+
+        # Guard against explosion if timings are very small (testing mode)
+        effective_duration = display_duration + isi
+        if effective_duration < 0.5:
+            logging.warning(
+                f"Detected fast timings ({effective_duration:.3f}s/trial). Using nominal 2.2s for trial count calculation to avoid explosion."
+            )
+            effective_duration = 2.2
+
+        # Ensure minimum trials
+        sub_block_trials = max(int(sub_block_duration / effective_duration), 1)
+        schedule.append((display_duration, isi, sub_block_trials))
+
+    return schedule
 
 
 def run_adaptive_nback_task(
@@ -1685,90 +2501,71 @@ def run_adaptive_nback_task(
     Notes
     -----
     Splits each block into 3 sub-blocks computed from `target_duration/num_blocks`.
+    Timings for all blocks are fixed up front by `build_adaptive_schedule`.
     """
     global skip_to_next_block
     n_level = initial_n
+    schedule = build_adaptive_schedule(
+        task_name, num_blocks, target_duration, starting_block_number
+    )
+
     # Loop through main blocks
-    for block in range(num_blocks):
+    for block, (display_duration, isi, sub_block_trials) in enumerate(schedule):
         cumulative_block_number = starting_block_number + block
         logging.info(
             f"\nStarting block {cumulative_block_number + 1} of {task_name} with n-back level: {n_level}"
         )
 
-        # Get adjusted timings for the current block
-        display_duration, isi = get_progressive_timings(
-            task_name, cumulative_block_number
-        )
-
-        # Calculate the number of trials per sub-block
-        sub_block_duration = target_duration / num_blocks / 3
-
-        # Guard against explosion if timings are very small (testing mode)
-        effective_duration = display_duration + isi
-        if effective_duration < 0.5:
-            logging.warning(
-                f"Detected fast timings ({effective_duration:.3f}s/trial). Using nominal 2.2s for trial count calculation to avoid explosion."
-            )
-            effective_duration = 2.2
-
-        sub_block_trials = int(sub_block_duration / effective_duration)
-        # Ensure minimum trials
-        sub_block_trials = max(sub_block_trials, 1)  # At least 1 trial
-
         # Accumulate lapses across sub-blocks for performance monitoring
         block_total_lapses = 0
         block_total_trials = 0
         block_skipped = False
 
-        for sub_block in range(3):
-            is_first_encounter = cumulative_block_number == 0 and sub_block == 0
+        # GC stays off for the whole main block (all three sub-blocks) and
+        # collects once before the performance check
+        with gc_paused():
+            for sub_block in range(3):
+                is_first_encounter = cumulative_block_number == 0 and sub_block == 0
 
-            # Run a sub-block using the provided run_block_function
-            # Returns (new_level, lapses, total_responses)
-            n_level, sub_lapses, sub_total = run_block_function(
-                win,
-                n_level,
-                num_trials=sub_block_trials,
-                display_duration=display_duration,
-                isi=isi,
-                is_first_encounter=is_first_encounter,
-                block_number=cumulative_block_number,
-                sub_block_index=sub_block,
-            )
-
-            block_total_lapses += sub_lapses
-            block_total_trials += sub_total
-
-            # Check for skip request (press 5)
-            if skip_to_next_block:
-                logging.warning(
-                    f"Block {cumulative_block_number + 1} of {task_name} SKIPPED by user at sub-block {sub_block + 1}"
-                )
-                skip_to_next_block = False  # Reset for next block
-                block_skipped = True
-                break  # Exit sub-block loop, move to next main block
-
-            # Display level change if n-back level was adjusted
-            if n_level != initial_n:
-                show_level_change_screen(
+                # Run a sub-block using the provided run_block_function
+                # Returns (new_level, lapses, total_responses)
+                n_level, sub_lapses, sub_total = run_block_function(
                     win,
-                    task_name,
-                    initial_n,
                     n_level,
-                    is_first_block=is_first_encounter,
+                    num_trials=sub_block_trials,
+                    display_duration=display_duration,
+                    isi=isi,
+                    is_first_encounter=is_first_encounter,
+                    block_number=cumulative_block_number,
+                    sub_block_index=sub_block,
                 )
-                initial_n = n_level  # Update initial_n to the new level
+
+                block_total_lapses += sub_lapses
+                block_total_trials += sub_total
+
+                # Check for skip request (press 5)
+                if skip_to_next_block:
+                    logging.warning(
+                        f"Block {cumulative_block_number + 1} of {task_name} SKIPPED by user at sub-block {sub_block + 1}"
+                    )
+                    skip_to_next_block = False  # Reset for next block
+                    block_skipped = True
+                    break  # Exit sub-block loop, move to next main block
+
+                # Display level change if n-back level was adjusted
+                if n_level != initial_n:
+                    show_level_change_screen(
+                        win,
+                        task_name,
+                        initial_n,
+                        n_level,
+                        is_first_block=is_first_encounter,
+                    )
+                    initial_n = n_level  # Update initial_n to the new level
 
         # --- Performance Monitor: check after each complete main block ---
         if not block_skipped and block_total_trials > 0:
-            try:
-                from wand_nback.common import load_gui_config
-                from wand_nback.performance_monitor import (
-                    MonitorConfig,
-                    check_adaptive_block,
-                    handle_flag,
-                )
-
+            if _HAVE_MONITOR:
                 monitor_cfg = MonitorConfig.from_gui_config(load_gui_config())
                 check = check_adaptive_block(
                     task_name=task_name,
@@ -1791,8 +2588,6 @@ def run_adaptive_nback_task(
                             f"[PERF MONITOR] Induction terminated after {task_name} Block {cumulative_block_number + 1}"
                         )
                         return "terminate"
-            except ImportError:
-                pass  # Monitor module not available — continue normally
 
 
 # =============================================================================
@@ -1823,6 +2618,10 @@ def run_dummy_session(win, n_back_level=2, num_trials=20):
     - Saves a timestamped CSV: `participant_dummy_n{level}_TestRun_{YYYYMMDD-HHMMSS}.csv`.
     - Closes the window and exits PsychoPy.
     """
+    global SESSION_TS
+    SESSION_TS = time.strftime("%Y%m%d-%H%M%S")
+    _init_paths()
+
     # --- 1) Bring the window forward and give it focus ---
     try:
         # pyglet backend: activate the context
@@ -1832,16 +2631,10 @@ def run_dummy_session(win, n_back_level=2, num_trials=20):
     core.wait(0.1)
 
     # --- 2) Instruction screen so user clicks and presses space ---
-    instr = visual.TextStim(
-        win,
-        text=get_text("dummy_run_instructions"),
-        color="white",
-        height=24,
-        wrapWidth=800,
-    )
+    instr = get_stim(win, "dummy_instructions", get_text("dummy_run_instructions"))
     instr.draw()
     win.flip()
-    keys = event.waitKeys(keyList=["space", "escape", "5"])
+    keys = wait_for_advance("Dummy-run instructions")
     if "escape" in keys:
         emergency_quit(win, "User pressed Escape - exiting experiment.")
     if "5" in keys:
@@ -1861,20 +2654,17 @@ def run_dummy_session(win, n_back_level=2, num_trials=20):
     )
 
     # --- 4) Save to a timestamped CSV ---
-    data_dir = os.path.join(base_dir, "data")
-    os.makedirs(data_dir, exist_ok=True)
-    timestamp = time.strftime("%Y%m%d-%H%M%S")
-    fname = f"participant_dummy_n{n_back_level}_TestRun_{timestamp}.csv"
+    fname = f"participant_dummy_n{n_back_level}_TestRun_{SESSION_TS}.csv"
 
     full_path = save_results_to_csv(
         fname,
         [
-            {
-                "Participant ID": "dummy",
-                "Task": f"Sequential {n_back_level}-back",
-                "Block": "TestRun",
-                "Results": dummy_results,
-            }
+            BlockResult(
+                participant_id="dummy",
+                task=f"Sequential {n_back_level}-back",
+                block="TestRun",
+                results=dummy_results,
+            )
         ],
     )
 
@@ -1901,14 +2691,14 @@ def main_task_flow():
     None
     """
     logging.info("Entering main_task_flow()")
+    global SESSION_TS
+    SESSION_TS = time.strftime("%Y%m%d-%H%M%S")
+    _init_paths()
+    log_listener = None
     try:
         # Hide the mouse cursor
         win.mouseVisible = False
 
-        # Track block numbers for progressive timing
-        spatial_block = 0
-        dual_block = 0
-
         subjective_measures = {}
 
         # Get participant info including N-back level
@@ -1916,31 +2706,24 @@ def main_task_flow():
         participant_id = exp_info["Participant ID"]
         n_back_level = exp_info["N-back Level"]
 
-        # Ensure monitor state is fresh for each new session.
-        try:
-            from wand_nback.performance_monitor import reset_flag_count
-
+        # Ensure monitor and welcome-screen state is fresh for each session.
+        if _HAVE_MONITOR:
             reset_flag_count()
-        except ImportError:
-            pass
+        _WELCOMED.clear()
+        _TIMING_LUT.clear()
 
         # -- apply GUI seed / distractor choices ------------
-        global GLOBAL_SEED, DISTRACTORS_ENABLED
+        global GLOBAL_SEED, DISTRACTORS_ENABLED, RNG, JITTER_RNG
         GLOBAL_SEED = exp_info["Seed"]
         DISTRACTORS_ENABLED = exp_info["Distractors"]
 
+        # Sequence generators in common draw from the stdlib `random` module
         if GLOBAL_SEED is not None:
             random.seed(GLOBAL_SEED)
-            try:
-                import numpy as np
-
-                np.random.seed(GLOBAL_SEED)
-            except ModuleNotFoundError:
-                pass
+        RNG = np.random.default_rng(GLOBAL_SEED)
+        JITTER_RNG = _make_jitter_rng(GLOBAL_SEED)
 
         # -- Load sequential timing from GUI config ------------
-        from wand_nback.common import load_gui_config
-
         gui_config = load_gui_config()
         if gui_config and "sequential" in gui_config:
             seq_display = float(gui_config["sequential"].get("display_duration", 0.8))
@@ -2158,32 +2941,36 @@ def main_task_flow():
                 except Exception as e:
                     logging.error(f"Error showing break screen: {e}")
 
-        # Set up the base directory and data directory
-        if getattr(sys, "frozen", False):
-            base_dir = sys._MEIPASS
-        else:
-            base_dir = os.path.dirname(os.path.abspath(__file__))
-        data_dir = os.path.join(base_dir, "data")
-        os.makedirs(data_dir, exist_ok=True)
-
         # Define the log filename and path
         log_filename = f"participant_{participant_id}_log.txt"
-        log_file_path = os.path.join(data_dir, log_filename)
+        log_file_path = os.path.join(DATA_DIR, log_filename)
 
-        # Create a custom handler that flushes after each record
-        flush_file_handler = FlushFileHandler(log_file_path, mode="w", encoding="utf-8")
-        flush_file_handler.setLevel(logging.DEBUG)
+        # File handler that is flushed in batches by the log listener
+        log_file_handler = BufferedFileHandler(
+            log_file_path, mode="w", encoding="utf-8"
+        )
+        log_file_handler.setLevel(logging.DEBUG)
         formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-        flush_file_handler.setFormatter(formatter)
-
-        # Configure logging with the custom handler
+        log_file_handler.setFormatter(formatter)
+
+        # Configure logging: records are queued on the task thread and written
+        # by a background listener, which flushes the file once per burst
+        log_queue = queue.Queue(-1)
+        log_listener = DrainingQueueListener(
+            log_queue,
+            log_file_handler,
+            logging.StreamHandler(),
+            respect_handler_level=True,
+        )
+        log_listener.start()
+        atexit.register(log_listener.stop)  # backstop; stopped in finally
         logging.getLogger().handlers = []  # Clear existing handlers
-        logging.getLogger().addHandler(flush_file_handler)
-        logging.getLogger().addHandler(logging.StreamHandler())
+        logging.getLogger().addHandler(logging.handlers.QueueHandler(log_queue))
         logging.getLogger().setLevel(logging.DEBUG)
 
         logging.info("Starting main_task_flow()")
         logging.info(f"Participant ID: {participant_id}")
+        logging.info(f"Session timestamp: {SESSION_TS}")
         logging.info(f"Selected N-back Level: {n_back_level}")
 
         # Calculate estimated duration using custom_block_order if available
@@ -2222,11 +3009,12 @@ def main_task_flow():
             )
         logging.info(f"Estimated duration: ~{estimated_duration} minutes")
 
+        prewarm_image_textures(win)
         show_overall_welcome_screen(win, duration=estimated_duration)
 
         # Familiarisation block before first Sequential N-back (only if Sequential enabled)
         if seq_enabled:
-            show_welcome_screen(win, "Sequential N-back", n_back_level)
+            show_welcome_once(win, "Sequential N-back", n_back_level)
             logging.info("Welcome screen shown")
 
             logging.info(
@@ -2240,16 +3028,13 @@ def main_task_flow():
                     match_key=response_keys["match"].upper(),
                     non_match_key=response_keys["non_match"].upper(),
                 )
-                instruction_text = visual.TextStim(
-                    win,
-                    text=familiarisation_text,
-                    color="white",
-                    height=24,
-                    wrapWidth=800,
+                instruction_text = get_stim(
+                    win, "familiarisation", familiarisation_text
                 )
                 instruction_text.draw()
                 win.flip()
-                keys = event.waitKeys(keyList=["space", "escape", "5"])
+                prewarm_subjective_measures(win)
+                keys = wait_for_advance("Familiarisation instructions")
                 if "escape" in keys or "5" in keys:
                     return
 
@@ -2267,12 +3052,10 @@ def main_task_flow():
                     block_number="PRACTICE",  # Changed from numerical block number
                 )
                 completion_text = get_text("induction_practice_complete")
-                completion_stim = visual.TextStim(
-                    win, text=completion_text, color="white", height=24, wrapWidth=800
-                )
+                completion_stim = get_stim(win, "completion", completion_text)
                 completion_stim.draw()
                 win.flip()
-                keys = event.waitKeys(keyList=["space", "escape", "5"])
+                keys = wait_for_advance("Familiarisation complete")
                 if "escape" in keys or "5" in keys:
                     return
             except Exception as e:
@@ -2299,8 +3082,11 @@ def main_task_flow():
         if max_loops == 0:
             logging.warning("No tasks enabled or blocks=0. Exiting loop.")
 
-        # Storage for results
-        all_sequential_results_list = []
+        # Combined results file: header now, each Sequential block appended as
+        # it completes, subjective measures appended at the end
+        results_filename = f"participant_{participant_id}_n{n_back_level}_results.csv"
+        save_results_to_csv(results_filename, [], participant_id=participant_id)
+        blocks_run = {"seq": 0, "spa": 0, "dual": 0, "measures": 0}
 
         # Force Standard Order: SPA -> DUAL (Counterbalance removed)
         task_A_name = "SPA"
@@ -2310,6 +3096,171 @@ def main_task_flow():
         start_time_str = datetime.now().strftime("%H:%M:%S")
         terminate_experiment = False
 
+        def log_block_completed(label, block_num):
+            """Log a finished block together with the elapsed session time."""
+            elapsed = time.time() - experiment_start_time
+            logging.info(
+                f"{label} - Block {block_num} COMPLETED. Elapsed: {int(elapsed // 60)}m {int(elapsed % 60)}s"
+            )
+
+        def run_sequential_task():
+            """
+            Run the next Sequential N-back block, save it and check performance.
+
+            Returns
+            -------
+            bool
+                True if the performance monitor asked to end the induction.
+            """
+            blocks_run["seq"] += 1
+            block_num = blocks_run["seq"]
+            now_str = datetime.now().strftime("%H:%M:%S")
+            logging.info(
+                f"[{now_str}] Starting Sequential {n_back_level}-back Task - Block {block_num}"
+            )
+            try:
+                if block_num > 1:
+                    show_transition_screen(win, "Sequential N-back")
+
+                seq_res = run_sequential_nback_block(
+                    win,
+                    n_back_level,
+                    num_images,
+                    target_percentage=0.5,
+                    display_duration=seq_display,
+                    isi=seq_isi,
+                    num_trials=164,
+                    is_first_encounter=block_num == 1,
+                    block_number=block_num,
+                )
+
+                # Save immediately, per block and to the combined file
+                save_sequential_results(
+                    participant_id, n_back_level, f"Block_{block_num}", seq_res
+                )
+                save_results_to_csv(
+                    results_filename,
+                    [
+                        BlockResult(
+                            participant_id=participant_id,
+                            task=f"Sequential {n_back_level}-back",
+                            block=block_num,
+                            n_back_level=n_back_level,
+                            results=seq_res,
+                        )
+                    ],
+                    mode="a",
+                    participant_id=participant_id,
+                )
+                append_trial_stream(
+                    f"participant_{participant_id}_stream.jsonl",
+                    participant_id,
+                    f"Sequential {n_back_level}-back",
+                    block_num,
+                    seq_res.get("Detailed Data", []),
+                )
+                log_block_completed("Sequential N-back Task", block_num)
+
+                # --- Performance Monitor: Sequential block ---
+                if _HAVE_MONITOR:
+                    monitor_cfg = MonitorConfig.from_gui_config(load_gui_config())
+                    check = check_sequential_block(seq_res, block_num, monitor_cfg)
+                    if check.flagged:
+                        decision = handle_flag(
+                            win,
+                            f"Sequential {n_back_level}-back",
+                            block_num,
+                            check,
+                            monitor_cfg,
+                            n_back_level=n_back_level,
+                        )
+                        if decision == "terminate":
+                            logging.warning(
+                                f"[PERF MONITOR] Induction terminated after Sequential Block {block_num}"
+                            )
+                            return True
+
+            except Exception as e:
+                logging.error(
+                    f"Error in Sequential N-back Task (Block {block_num}): {e}"
+                )
+                logging.exception("Exception occurred")
+            return False
+
+        # Adaptive tasks: block type -> (display name, block runner)
+        adaptive_tasks = {
+            "spa": ("Spatial N-back", run_spatial_nback_block),
+            "dual": ("Dual N-back", run_dual_nback_block),
+        }
+
+        def run_adaptive_task(block_type):
+            """
+            Run the next adaptive Spatial or Dual N-back block.
+
+            Parameters
+            ----------
+            block_type : str
+                ``"spa"`` or ``"dual"``.
+
+            Returns
+            -------
+            bool
+                True if the performance monitor asked to end the induction.
+            """
+            task_name, block_runner = adaptive_tasks[block_type]
+            completed = blocks_run[block_type]
+            now_str = datetime.now().strftime("%H:%M:%S")
+            logging.info(
+                f"[{now_str}] Starting {task_name} Task - Block {completed + 1}"
+            )
+            try:
+                show_transition_screen(win, task_name)
+                show_welcome_once(win, task_name)
+
+                adaptive_decision = run_adaptive_nback_task(
+                    win,
+                    task_name,
+                    n_back_level,
+                    1,
+                    270,
+                    block_runner,
+                    starting_block_number=completed,
+                )
+                if adaptive_decision == "terminate":
+                    logging.warning(
+                        f"[PERF MONITOR] Induction terminated after {task_name.split()[0]} Block {completed + 1}"
+                    )
+                    return True
+                blocks_run[block_type] = completed + 1
+                log_block_completed(f"{task_name} Task", completed + 1)
+            except Exception as e:
+                logging.error(f"Error in {task_name} Task (Block {completed + 1}): {e}")
+            return False
+
+        def run_custom_break():
+            """Show a Block Builder break screen (never ends the induction)."""
+            now_str = datetime.now().strftime("%H:%M:%S")
+            logging.info(f"[{now_str}] Showing Break Screen")
+            try:
+                show_break_screen(win, break_duration)
+            except Exception as e:
+                logging.error(f"Error showing break: {e}")
+            return False
+
+        def run_custom_measures():
+            """Collect a numbered set of Block Builder subjective measures."""
+            blocks_run["measures"] += 1
+            measures_key = f"Custom_{blocks_run['measures']}"
+            now_str = datetime.now().strftime("%H:%M:%S")
+            logging.info(
+                f"[{now_str}] Collecting Subjective Measures ({blocks_run['measures']})"
+            )
+            try:
+                subjective_measures[measures_key] = collect_subjective_measures(win)
+            except Exception as e:
+                logging.error(f"Error collecting measures: {e}")
+            return False
+
         loop_msg = f"Starting Main Loop at {start_time_str}. Max Loops: {max_loops}."
         if spa_enabled or dual_enabled:
             loop_msg += f" (Odd: {task_A_name}->{task_B_name})"
@@ -2321,11 +3272,17 @@ def main_task_flow():
             # CUSTOM ORDER: Execute blocks in exact Block Builder sequence
             logging.info("--- USING CUSTOM BLOCK ORDER FROM BLOCK BUILDER ---")
 
-            # Track block counts for numbering
-            seq_block_num = 0
-            spa_block_num = 0
-            dual_block_num = 0
-            measures_count = 0
+            # Block type -> handler; disabled tasks are simply absent
+            custom_handlers = {
+                "break": run_custom_break,
+                "measures": run_custom_measures,
+            }
+            if seq_enabled:
+                custom_handlers["seq"] = run_sequential_task
+            if spa_enabled:
+                custom_handlers["spa"] = lambda: run_adaptive_task("spa")
+            if dual_enabled:
+                custom_handlers["dual"] = lambda: run_adaptive_task("dual")
 
             for block_idx, block in enumerate(custom_block_order):
                 block_type = block.get("type", "")
@@ -2334,191 +3291,13 @@ def main_task_flow():
                 if block_type in ("start", "end"):
                     continue
 
-                now_str = datetime.now().strftime("%H:%M:%S")
                 logging.info(
                     f"--- CUSTOM BLOCK {block_idx + 1}: {block_type.upper()} ---"
                 )
-
-                # SEQUENTIAL
-                if block_type == "seq" and seq_enabled:
-                    seq_block_num += 1
-                    logging.info(
-                        f"[{now_str}] Starting Sequential {n_back_level}-back Task - Block {seq_block_num}"
-                    )
-                    try:
-                        if seq_block_num > 1:
-                            show_transition_screen(win, "Sequential N-back")
-
-                        is_first = seq_block_num == 1
-                        seq_res = run_sequential_nback_block(
-                            win,
-                            n_back_level,
-                            num_images,
-                            target_percentage=0.5,
-                            display_duration=seq_display,
-                            isi=seq_isi,
-                            num_trials=164,
-                            is_first_encounter=is_first,
-                            block_number=seq_block_num,
-                        )
-                        save_sequential_results(
-                            participant_id,
-                            n_back_level,
-                            f"Block_{seq_block_num}",
-                            seq_res,
-                        )
-                        all_sequential_results_list.append((seq_block_num, seq_res))
-                        elapsed = time.time() - experiment_start_time
-                        logging.info(
-                            f"Sequential Block {seq_block_num} COMPLETED. Elapsed: {int(elapsed // 60)}m {int(elapsed % 60)}s"
-                        )
-
-                        # --- Performance Monitor: Sequential block ---
-                        try:
-                            from wand_nback.common import load_gui_config
-                            from wand_nback.performance_monitor import (
-                                MonitorConfig,
-                                check_sequential_block,
-                                handle_flag,
-                            )
-
-                            monitor_cfg = MonitorConfig.from_gui_config(
-                                load_gui_config()
-                            )
-                            check = check_sequential_block(
-                                seq_res, seq_block_num, monitor_cfg
-                            )
-                            if check.flagged:
-                                decision = handle_flag(
-                                    win,
-                                    f"Sequential {n_back_level}-back",
-                                    seq_block_num,
-                                    check,
-                                    monitor_cfg,
-                                    n_back_level=n_back_level,
-                                )
-                                if decision == "terminate":
-                                    logging.warning(
-                                        f"[PERF MONITOR] Induction terminated after Sequential Block {seq_block_num}"
-                                    )
-                                    terminate_experiment = True
-                                    break
-                        except ImportError:
-                            pass  # Monitor module not available
-
-                    except Exception as e:
-                        logging.error(
-                            f"Error in Sequential N-back (Block {seq_block_num}): {e}"
-                        )
-                        logging.exception("Exception occurred")
-
-                # SPATIAL
-                elif block_type == "spa" and spa_enabled:
-                    logging.info(
-                        f"[{now_str}] Starting Spatial N-back Task - Block {spa_block_num + 1}"
-                    )
-                    try:
-                        show_transition_screen(win, "Spatial N-back")
-                        if spa_block_num == 0:
-                            show_welcome_screen(win, "Spatial N-back")
-
-                        adaptive_decision = run_adaptive_nback_task(
-                            win,
-                            "Spatial N-back",
-                            n_back_level,
-                            1,
-                            270,
-                            lambda w, n, num_trials, display_duration, isi, is_first_encounter, block_number, sub_block_index=None: run_spatial_nback_block(
-                                w,
-                                n,
-                                num_trials,
-                                display_duration,
-                                isi,
-                                is_first_encounter,
-                                block_number=block_number,
-                                sub_block_index=sub_block_index,
-                            ),
-                            starting_block_number=spa_block_num,
-                        )
-                        if adaptive_decision == "terminate":
-                            logging.warning(
-                                f"[PERF MONITOR] Induction terminated after Spatial Block {spa_block_num + 1}"
-                            )
-                            terminate_experiment = True
-                            break
-                        spa_block_num += 1
-                        elapsed = time.time() - experiment_start_time
-                        logging.info(
-                            f"Spatial Block {spa_block_num} COMPLETED. Elapsed: {int(elapsed // 60)}m {int(elapsed % 60)}s"
-                        )
-                    except Exception as e:
-                        logging.error(
-                            f"Error in Spatial N-back (Block {spa_block_num}): {e}"
-                        )
-
-                # DUAL
-                elif block_type == "dual" and dual_enabled:
-                    logging.info(
-                        f"[{now_str}] Starting Dual N-back Task - Block {dual_block_num + 1}"
-                    )
-                    try:
-                        show_transition_screen(win, "Dual N-back")
-                        if dual_block_num == 0:
-                            show_welcome_screen(win, "Dual N-back")
-
-                        adaptive_decision = run_adaptive_nback_task(
-                            win,
-                            "Dual N-back",
-                            n_back_level,
-                            1,
-                            270,
-                            lambda w, n, num_trials, display_duration, isi, is_first_encounter, block_number, sub_block_index=None: run_dual_nback_block(
-                                w,
-                                n,
-                                num_trials,
-                                display_duration,
-                                isi,
-                                is_first_encounter,
-                                block_number=block_number,
-                                sub_block_index=sub_block_index,
-                            ),
-                            starting_block_number=dual_block_num,
-                        )
-                        if adaptive_decision == "terminate":
-                            logging.warning(
-                                f"[PERF MONITOR] Induction terminated after Dual Block {dual_block_num + 1}"
-                            )
-                            terminate_experiment = True
-                            break
-                        dual_block_num += 1
-                        elapsed = time.time() - experiment_start_time
-                        logging.info(
-                            f"Dual Block {dual_block_num} COMPLETED. Elapsed: {int(elapsed // 60)}m {int(elapsed % 60)}s"
-                        )
-                    except Exception as e:
-                        logging.error(
-                            f"Error in Dual N-back (Block {dual_block_num}): {e}"
-                        )
-
-                # BREAK
-                elif block_type == "break":
-                    logging.info(f"[{now_str}] Showing Break Screen")
-                    try:
-                        show_break_screen(win, break_duration)
-                    except Exception as e:
-                        logging.error(f"Error showing break: {e}")
-
-                # MEASURES
-                elif block_type == "measures":
-                    measures_count += 1
-                    logging.info(
-                        f"[{now_str}] Collecting Subjective Measures ({measures_count})"
-                    )
-                    try:
-                        measures = collect_subjective_measures(win)
-                        subjective_measures[f"Custom_{measures_count}"] = measures
-                    except Exception as e:
-                        logging.error(f"Error collecting measures: {e}")
+                handler = custom_handlers.get(block_type)
+                if handler is not None and handler():
+                    terminate_experiment = True
+                    break
 
         else:
             # STANDARD CYCLE-BASED EXECUTION (no Block Builder)
@@ -2527,91 +3306,17 @@ def main_task_flow():
 
                 # 1. SEQUENTIAL N-BACK
                 if seq_enabled and cycle_num <= seq_blocks:
-                    now_str = datetime.now().strftime("%H:%M:%S")
-                    logging.info(
-                        f"[{now_str}] Starting Sequential {n_back_level}-back Task - Block {cycle_num}"
-                    )
-                    try:
-                        # Show transition only if not Block 1 (or always? Code used Block 1 welcome only, transitions for rest)
-                        if cycle_num > 1:
-                            show_transition_screen(win, "Sequential N-back")
-
-                        # Logic for Block 1 was using is_first_encounter=True.
-                        is_first = cycle_num == 1
-
-                        seq_res = run_sequential_nback_block(
-                            win,
-                            n_back_level,
-                            num_images,
-                            target_percentage=0.5,
-                            display_duration=seq_display,
-                            isi=seq_isi,
-                            num_trials=164,
-                            is_first_encounter=is_first,
-                            block_number=cycle_num,
-                        )
-
-                        # Save immediately
-                        save_sequential_results(
-                            participant_id, n_back_level, f"Block_{cycle_num}", seq_res
-                        )
-
-                        # Store for final summary
-                        all_sequential_results_list.append((cycle_num, seq_res))
-                        elapsed = time.time() - experiment_start_time
-                        logging.info(
-                            f"Sequential N-back Task - Block {cycle_num} COMPLETED. Elapsed: {int(elapsed // 60)}m {int(elapsed % 60)}s"
-                        )
-
-                        # --- Performance Monitor: Sequential block ---
-                        try:
-                            from wand_nback.common import load_gui_config
-                            from wand_nback.performance_monitor import (
-                                MonitorConfig,
-                                check_sequential_block,
-                                handle_flag,
-                            )
-
-                            monitor_cfg = MonitorConfig.from_gui_config(
-                                load_gui_config()
-                            )
-                            check = check_sequential_block(
-                                seq_res, cycle_num, monitor_cfg
-                            )
-                            if check.flagged:
-                                decision = handle_flag(
-                                    win,
-                                    f"Sequential {n_back_level}-back",
-                                    cycle_num,
-                                    check,
-                                    monitor_cfg,
-                                    n_back_level=n_back_level,
-                                )
-                                if decision == "terminate":
-                                    logging.warning(
-                                        f"[PERF MONITOR] Induction terminated after Sequential Block {cycle_num}"
-                                    )
-                                    # Jump to final save
-                                    terminate_experiment = True
-                                    break
-                        except ImportError:
-                            pass  # Monitor module not available
-
-                    except Exception as e:
-                        logging.error(
-                            f"Error in Sequential N-back Task (Block {cycle_num}): {e}"
-                        )
-                        logging.exception("Exception occurred")
+                    if run_sequential_task():
+                        terminate_experiment = True
+                        break
 
                 # 2. SCHEDULED EVENTS (Breaks / Measures)
-                # Run these immediately after Sequential (matches logic of previous Block 2-5)
-                # This ensures "Break after Block X" happens before the Spatial/Dual loads.
+                # Run these immediately after Sequential so that "Break after
+                # Block X" happens before the Spatial/Dual loads.
                 run_scheduled_events(cycle_num)
 
                 # 3. GROUP (SPATIAL / DUAL)
-                # Determine order for this cycle
-                # Odd (1, 3...): [A, B]
-                # Even (2, 4...): [B, A]
+                # Odd cycles (1, 3...): [A, B]; even cycles (2, 4...): [B, A]
                 if cycle_num % 2 != 0:
                     current_order = [task_A_name, task_B_name]
                 else:
@@ -2620,146 +3325,39 @@ def main_task_flow():
                 if spa_enabled or dual_enabled:
                     logging.info(f"Loop {cycle_num} Group Order: {current_order}")
 
+                group_tasks = {
+                    "SPA": ("spa", spa_enabled and cycle_num <= spa_blocks),
+                    "DUAL": ("dual", dual_enabled and cycle_num <= dual_blocks),
+                }
                 for task_type in current_order:
-                    # --- SPATIAL ---
-                    if task_type == "SPA":
-                        if spa_enabled and cycle_num <= spa_blocks:
-                            now_str = datetime.now().strftime("%H:%M:%S")
-                            logging.info(
-                                f"[{now_str}] Starting Spatial N-back Task - Block {cycle_num}"
-                            )
-                            try:
-                                show_transition_screen(win, "Spatial N-back")
-                                # Block 1 used welcome screen? Standard logic is Transition.
-                                # Previous code: Block 1 had `show_welcome_screen`. Block 2+ Transition.
-                                if cycle_num == 1:
-                                    show_welcome_screen(win, "Spatial N-back")
-
-                                adaptive_decision = run_adaptive_nback_task(
-                                    win,
-                                    "Spatial N-back",
-                                    n_back_level,
-                                    1,
-                                    270,
-                                    lambda w, n, num_trials, display_duration, isi, is_first_encounter, block_number, sub_block_index=None: run_spatial_nback_block(
-                                        w,
-                                        n,
-                                        num_trials,
-                                        display_duration,
-                                        isi,
-                                        is_first_encounter,
-                                        block_number=block_number,
-                                        sub_block_index=sub_block_index,
-                                    ),
-                                    starting_block_number=spatial_block,
-                                )
-                                if adaptive_decision == "terminate":
-                                    logging.warning(
-                                        f"[PERF MONITOR] Induction terminated after Spatial Block {spatial_block + 1}"
-                                    )
-                                    terminate_experiment = True
-                                    break
-                                spatial_block += 1
-
-                                elapsed = time.time() - experiment_start_time
-                                logging.info(
-                                    f"Spatial N-back Task - Block {cycle_num} COMPLETED. Elapsed: {int(elapsed // 60)}m {int(elapsed % 60)}s"
-                                )
-                            except Exception as e:
-                                logging.error(
-                                    f"Error in Spatial N-back Task ({cycle_num}): {e}"
-                                )
-
-                    # --- DUAL ---
-                    elif task_type == "DUAL":
-                        if dual_enabled and cycle_num <= dual_blocks:
-                            now_str = datetime.now().strftime("%H:%M:%S")
-                            logging.info(
-                                f"[{now_str}] Starting Dual N-back Task - Block {cycle_num}"
-                            )
-                            try:
-                                show_transition_screen(win, "Dual N-back")
-                                if cycle_num == 1:
-                                    show_welcome_screen(win, "Dual N-back")
-
-                                adaptive_decision = run_adaptive_nback_task(
-                                    win,
-                                    "Dual N-back",
-                                    n_back_level,
-                                    1,
-                                    270,
-                                    lambda w, n, num_trials, display_duration, isi, is_first_encounter, block_number, sub_block_index=None: run_dual_nback_block(
-                                        w,
-                                        n,
-                                        num_trials,
-                                        display_duration,
-                                        isi,
-                                        is_first_encounter,
-                                        block_number=block_number,
-                                        sub_block_index=sub_block_index,
-                                    ),
-                                    starting_block_number=dual_block,
-                                )
-                                if adaptive_decision == "terminate":
-                                    logging.warning(
-                                        f"[PERF MONITOR] Induction terminated after Dual Block {dual_block + 1}"
-                                    )
-                                    terminate_experiment = True
-                                    break
-                                dual_block += 1
-
-                                elapsed = time.time() - experiment_start_time
-                                logging.info(
-                                    f"Dual N-back Task - Block {cycle_num} COMPLETED. Elapsed: {int(elapsed // 60)}m {int(elapsed % 60)}s"
-                                )
-                            except Exception as e:
-                                logging.error(
-                                    f"Error in Dual N-back Task ({cycle_num}): {e}"
-                                )
+                    block_type, scheduled = group_tasks[task_type]
+                    if scheduled and run_adaptive_task(block_type):
+                        terminate_experiment = True
+                        break
 
                 if terminate_experiment:
                     break
 
-        # Save results to CSV (Final Summary)
+        # Append subjective measures to the combined results CSV
         logging.info("Saving results to CSV")
         try:
-            results_filename = (
-                f"participant_{participant_id}_n{n_back_level}_results.csv"
-            )
-
-            # Construct all_results from stored list
-            all_results = []
-            for b_num, res in all_sequential_results_list:
-                all_results.append(
-                    {
-                        "Participant ID": participant_id,
-                        "N-back Level": n_back_level,
-                        "Task": f"Sequential {n_back_level}-back",
-                        "Block": b_num,
-                        "Results": res,
-                    }
-                )
-
             saved_file_path = save_results_to_csv(
                 results_filename,
-                all_results,
+                [],
                 subjective_measures,
+                mode="a",
                 participant_id=participant_id,
             )
             logging.info(f"Results and subjective measures saved to {saved_file_path}")
 
-            final_message = visual.TextStim(
+            final_message = get_stim(
                 win,
-                text=get_text(
-                    "induction_final_message", saved_file_path=saved_file_path
-                ),
-                color="white",
-                height=24,
-                wrapWidth=800,
+                "final_message",
+                get_text("induction_final_message", saved_file_path=saved_file_path),
             )
             final_message.draw()
             win.flip()
-            keys = event.waitKeys(keyList=["space", "escape", "5"])
+            keys = wait_for_advance("Final message")
             if "escape" in keys:
                 emergency_quit(win, "User pressed Escape - exiting experiment.")
             if "5" in keys:
@@ -2767,12 +3365,18 @@ def main_task_flow():
         except Exception as e:
             logging.info(f"Error in saving results to CSV: {e}")
             logging.exception("Exception occurred")
-    except Exception as e:
-        logging.info(f"Error in main_task_flow: {e}")
+    except Exception:
+        # Logged here because core.quit() below would otherwise hide it
         logging.exception("Exception occurred in main_task_flow")
-    logging.info("Exiting main_task_flow()")
-    win.close()
-    core.quit()
+    finally:
+        # Early returns (Escape / skip on instruction screens) clean up too
+        logging.info("Exiting main_task_flow()")
+        if log_listener is not None:
+            # Write out every queued record before the window closes
+            log_listener.stop()
+            log_file_handler.close()
+        win.close()
+        core.quit()
 
 
 if __name__ == "__main__":
@@ -368,12 +368,96 @@ def get_gui_timing(task_type, param_name, default):
 
 # Stimulus setup
 image_dir = os.path.join(base_dir, "stimuli", "apophysis")
-image_files = [f for f in os.listdir(image_dir) if f.endswith(".png")]
+# Sorted so seeded image draws do not depend on filesystem listing order
+with os.scandir(image_dir) as entries:
+    image_files = sorted(
+        e.name for e in entries if e.is_file() and e.name.endswith(".png")
+    )
 
 if len(image_files) < 24:
     print("Not enough images found in directory")
     sys.exit(1)
 
+# ImageStims keyed by (file name, size); filled lazily once the window exists
+_image_stim_cache = {}
+
+
+def get_image_stim(win, image_file, size):
+    """
+    Return a cached ImageStim for ``image_file``, loading it on first use.
+
+    Decoding the PNG and uploading its texture happens once per image and size,
+    so calling this before a block starts keeps disk and GPU work out of trials.
+
+    Parameters
+    ----------
+    win : psychopy.visual.Window
+        PsychoPy window.
+    image_file : str
+        File name inside ``image_dir``.
+    size : Tuple[int, int]
+        (width, height) in pixels.
+
+    Returns
+    -------
+    psychopy.visual.ImageStim
+        The shared stimulus; callers set ``pos`` before drawing.
+    """
+    key = (image_file, tuple(size))
+    stim = _image_stim_cache.get(key)
+    if stim is None:
+        stim = visual.ImageStim(
+            win, image=os.path.join(image_dir, image_file), size=size
+        )
+        _image_stim_cache[key] = stim
+    return stim
+
+
+# Sequential practice scenery per N-back level: (background, isi_background)
+_sequential_scenery = {}
+
+
+def get_sequential_scenery(win, n):
+    """
+    Return pre-rendered Sequential practice frames for an N-back level.
+
+    Grid, level label and fixation cross do not change within a block, so
+    they are rendered once into `visual.BufferImageStim` snapshots and each
+    frame draws a single textured quad. Snapshots are rebuilt only when a
+    new level (and so a new label) is first seen.
+
+    Parameters
+    ----------
+    win : psychopy.visual.Window
+        PsychoPy window.
+    n : int
+        N-back level shown in the label.
+
+    Returns
+    -------
+    Tuple[psychopy.visual.BufferImageStim, psychopy.visual.BufferImageStim]
+        Grid plus level label, and the same with the fixation cross for ISIs.
+    """
+    cached = _sequential_scenery.get(n)
+    if cached is not None and cached[0].win is win:
+        return cached
+
+    level_text = visual.TextStim(
+        win,
+        text=get_text("level_label", n=n),
+        color="white",
+        height=24,
+        pos=(-450, 350),
+    )
+    fixation = visual.TextStim(win, text="+", color="white", height=32)
+    background = visual.BufferImageStim(win, stim=[*grid_lines, level_text])
+    isi_background = visual.BufferImageStim(
+        win, stim=[*grid_lines, level_text, fixation]
+    )
+    win.clearBuffer()
+    _sequential_scenery[n] = (background, isi_background)
+    return background, isi_background
+
 
 # =============================================================================
 #  SECTION 4: USER INTERACTION & MENUS
@@ -712,9 +796,8 @@ def draw_sequence(win, seq_images, positions, size=(100, 100), current_idx=None)
     None
     """
     for i, (img_file, pos) in enumerate(zip(seq_images, positions)):
-        stim = visual.ImageStim(
-            win, image=os.path.join(image_dir, img_file), pos=pos, size=size
-        )
+        stim = get_image_stim(win, img_file, size)
+        stim.pos = pos
         stim.draw()
 
 
@@ -885,7 +968,6 @@ def show_spatial_demo(win, n=2, num_demo_trials=6, display_duration=1.0, isi=1.0
     if "5" in keys:
         return
 
-    nback_queue = []
     for i, current_pos in enumerate(demo_positions):
         trial_num = i + 1
 
@@ -901,7 +983,7 @@ def show_spatial_demo(win, n=2, num_demo_trials=6, display_duration=1.0, isi=1.0
 
         # Feedback from trial 3 onward (brief)
         if trial_num > n:
-            old_pos = nback_queue[-n]
+            old_pos = demo_positions[i - n]
             is_target = current_pos == old_pos
             display_grid(win, highlight_pos=None, highlight=False, n_level=n)
             display_feedback(win, is_target, pos=(0, 400))
@@ -911,9 +993,6 @@ def show_spatial_demo(win, n=2, num_demo_trials=6, display_duration=1.0, isi=1.0
             core.wait(0.5)
 
         core.wait(isi)
-        nback_queue.append(current_pos)
-        if len(nback_queue) > n:
-            nback_queue.pop(0)
 
     # End of PASS 1
     draw_grid()
@@ -941,8 +1020,7 @@ def show_spatial_demo(win, n=2, num_demo_trials=6, display_duration=1.0, isi=1.0
     if "5" in keys:
         return
 
-    # Reset queue for PASS 2
-    nback_queue = []
+    # PASS 2
     for i, current_pos in enumerate(demo_positions):
         trial_num = i + 1
 
@@ -959,7 +1037,7 @@ def show_spatial_demo(win, n=2, num_demo_trials=6, display_duration=1.0, isi=1.0
 
         # Extended feedback for trial > n (with stimulus still visible)
         if trial_num > n:
-            old_pos = nback_queue[-n]
+            old_pos = demo_positions[i - n]
             is_target = current_pos == old_pos
 
             # Redraw the grid with the current position still highlighted
@@ -1034,10 +1112,6 @@ def show_spatial_demo(win, n=2, num_demo_trials=6, display_duration=1.0, isi=1.0
             if "escape" in keys or "5" in keys:
                 return
 
-        nback_queue.append(current_pos)
-        if len(nback_queue) > n:
-            nback_queue.pop(0)
-
     # End of PASS 2
     draw_grid()
     pass2_end_text = get_text("demo_pass2_end")
@@ -1088,6 +1162,20 @@ def show_dual_demo(win, n=2, num_demo_trials=6, display_duration=1.0, isi=1.2):
         num_demo_trials, grid_size, n, image_files, target_rate=demo_rate
     )
 
+    # Grid, level colour and label are the same on every demo trial
+    level_color = get_level_color(n)
+    grid, outline = create_grid(win, grid_size)
+    for rect in grid:
+        rect.lineColor = level_color
+    outline.lineColor = level_color
+    level_text = visual.TextStim(
+        win,
+        text=get_text("level_label", n=n),
+        color="white",
+        height=24,
+        pos=(-450, 350),
+    )
+
     intro_text = get_text(
         "demo_intro", task_name="Dual", n=n, num_demo_trials=num_demo_trials
     )
@@ -1117,7 +1205,6 @@ def show_dual_demo(win, n=2, num_demo_trials=6, display_duration=1.0, isi=1.2):
     if "5" in keys:
         return
 
-    nback_queue = []
     for i, (pos, img) in enumerate(zip(demo_positions, demo_images)):
         trial_num = i + 1
 
@@ -1125,21 +1212,11 @@ def show_dual_demo(win, n=2, num_demo_trials=6, display_duration=1.0, isi=1.2):
         dual_stim = display_dual_stimulus(
             win, pos, img, grid_size, n_level=n, return_stim=True
         )
-        grid, outline = create_grid(win, grid_size)
-        level_text = visual.TextStim(
-            win,
-            text=get_text("level_label", n=n),
-            color="white",
-            height=24,
-            pos=(-450, 350),
-        )
 
         def draw_current_state():
             draw_grid()
             for rect in grid:
-                rect.lineColor = get_level_color(n)
                 rect.draw()
-            outline.lineColor = get_level_color(n)
             outline.draw()
             if dual_stim:
                 dual_stim.draw()
@@ -1157,7 +1234,7 @@ def show_dual_demo(win, n=2, num_demo_trials=6, display_duration=1.0, isi=1.2):
 
         # For trials > n, show brief feedback.
         if trial_num > n:
-            old_pos, old_img = nback_queue[-n]
+            old_pos, old_img = demo_positions[i - n], demo_images[i - n]
             is_target = pos == old_pos and img == old_img
             draw_current_state()
             display_feedback(win, is_target, pos=(0, 400))
@@ -1167,9 +1244,6 @@ def show_dual_demo(win, n=2, num_demo_trials=6, display_duration=1.0, isi=1.2):
             core.wait(0.5)
 
         core.wait(0.2)
-        nback_queue.append((pos, img))
-        if len(nback_queue) > n:
-            nback_queue.pop(0)
 
     draw_grid()
     pass1_end_text = get_text("demo_pass1_end")
@@ -1196,8 +1270,7 @@ def show_dual_demo(win, n=2, num_demo_trials=6, display_duration=1.0, isi=1.2):
     if "5" in keys:
         return
 
-    # Reset queue for PASS 2.
-    nback_queue = []
+    # PASS 2
     for i, (pos, img) in enumerate(zip(demo_positions, demo_images)):
         trial_num = i + 1
 
@@ -1205,21 +1278,11 @@ def show_dual_demo(win, n=2, num_demo_trials=6, display_duration=1.0, isi=1.2):
         dual_stim = display_dual_stimulus(
             win, pos, img, grid_size, n_level=n, return_stim=True
         )
-        grid, outline = create_grid(win, grid_size)
-        level_text = visual.TextStim(
-            win,
-            text=get_text("level_label", n=n),
-            color="white",
-            height=24,
-            pos=(-450, 350),
-        )
 
         def draw_current_state(with_dual_stim=True):
             draw_grid()
             for rect in grid:
-                rect.lineColor = get_level_color(n)
                 rect.draw()
-            outline.lineColor = get_level_color(n)
             outline.draw()
             if with_dual_stim and dual_stim:
                 dual_stim.draw()
@@ -1235,7 +1298,7 @@ def show_dual_demo(win, n=2, num_demo_trials=6, display_duration=1.0, isi=1.2):
                 display_duration
             )  # Wait the display duration but keep stimulus visible
 
-            old_pos, old_img = nback_queue[-n]
+            old_pos, old_img = demo_positions[i - n], demo_images[i - n]
             is_target = pos == old_pos and img == old_img
 
             # Redraw everything including current stimulus
@@ -1318,10 +1381,6 @@ def show_dual_demo(win, n=2, num_demo_trials=6, display_duration=1.0, isi=1.2):
             if "escape" in keys or "5" in keys:
                 return
 
-        nback_queue.append((pos, img))
-        if len(nback_queue) > n:
-            nback_queue.pop(0)
-
     draw_grid()
     pass2_end_text = get_text("demo_pass2_end")
     pass2_end_stim = visual.TextStim(
@@ -1393,9 +1452,8 @@ def show_sequential_demo(win, n=2, num_demo_trials=6, display_duration=0.8, isi=
         trial_num = i + 1
         # Present the current image centered.
         img = demo_sequence[i]
-        stim = visual.ImageStim(
-            win, image=os.path.join(image_dir, img), pos=(0, 0), size=stim_size
-        )
+        stim = get_image_stim(win, img, stim_size)
+        stim.pos = (0, 0)
         stim.draw()
         win.flip()
         core.wait(display_duration)
@@ -1458,19 +1516,27 @@ def show_sequential_demo(win, n=2, num_demo_trials=6, display_duration=0.8, isi=
         num_demo_trials, ref_index=0, spacing=spacing, center_x=0, y=0
     )
 
+    # Text stims are built once; each demo step only updates their text
+    level_stim = visual.TextStim(
+        win,
+        text=get_text("level_label", n=n),
+        color="white",
+        height=24,
+        pos=(-450, 350),
+    )
+    tick = visual.TextStim(win, text="✓", color="green", height=48, pos=(0, 150))
+    cross = visual.TextStim(win, text="✗", color="red", height=48, pos=(0, 150))
+    feedback_stim = visual.TextStim(
+        win, text="", color="white", height=24, pos=(0, -250)
+    )
+    prompt_stim = visual.TextStim(win, text="", color="white", height=24, pos=(0, -300))
+
     for i in range(num_demo_trials):
         trial_num = i + 1
         # Compute shifted positions so that the current trial is centered
         shifted_positions = [(x - i * spacing, y) for (x, y) in positions0]
 
         # Draw level indicator
-        level_stim = visual.TextStim(
-            win,
-            text=get_text("level_label", n=n),
-            color="white",
-            height=24,
-            pos=(-450, 350),
-        )
         level_stim.draw()
 
         # Calculate current position (stimulus i in the sequence)
@@ -1494,21 +1560,14 @@ def show_sequential_demo(win, n=2, num_demo_trials=6, display_duration=0.8, isi=
 
             # Show tick or cross
             if is_match:
-                tick = visual.TextStim(
-                    win, text="✓", color="green", height=48, pos=(0, 150)
-                )
+                tick.draw()
                 fb_text = get_text("demo_feedback_match_seq")
             else:
-                tick = visual.TextStim(
-                    win, text="✗", color="red", height=48, pos=(0, 150)
-                )
+                cross.draw()
                 fb_text = get_text("demo_feedback_mismatch_seq")
-            tick.draw()
 
             # Show concise feedback text
-            feedback_stim = visual.TextStim(
-                win, text=fb_text, color="white", height=24, pos=(0, -250)
-            )
+            feedback_stim.text = fb_text
             feedback_stim.draw()
         else:
             # For trials before or equal to n, explain why there's no reference yet
@@ -1517,9 +1576,7 @@ def show_sequential_demo(win, n=2, num_demo_trials=6, display_duration=0.8, isi=
             else:  # trial_num == n
                 n_plus_one = n + 1
                 fb_text = get_text("demo_seq_wait", n=n, n_plus_one=n_plus_one)
-            feedback_stim = visual.TextStim(
-                win, text=fb_text, color="white", height=24, pos=(0, -250)
-            )
+            feedback_stim.text = fb_text
             feedback_stim.draw()
 
         # Show prompt for all trials
@@ -1527,9 +1584,7 @@ def show_sequential_demo(win, n=2, num_demo_trials=6, display_duration=0.8, isi=
             prompt_text = get_text("demo_proceed_final")
         else:
             prompt_text = get_text("demo_proceed_next")
-        prompt_stim = visual.TextStim(
-            win, text=prompt_text, color="white", height=24, pos=(0, -300)
-        )
+        prompt_stim.text = prompt_text
         prompt_stim.draw()
 
         # Display everything at once
@@ -1597,11 +1652,9 @@ def run_spatial_nback_practice(n, num_trials=50, display_duration=None, isi=None
     isi = T(isi)
     global skip_to_next_stage
     positions = generate_positions_with_matches(num_trials, n)
-    nback_queue = []
     correct_responses = 0
     incorrect_responses = 0
     lapses = 0
-    reaction_times = []
 
     last_lapse = False
 
@@ -1630,7 +1683,7 @@ def run_spatial_nback_practice(n, num_trials=50, display_duration=None, isi=None
         if skip_to_next_stage:
             break
 
-        is_target = len(nback_queue) >= n and pos == nback_queue[-n]
+        is_target = i >= n and pos == positions[i - n]
 
         # 1. Presentation Phase
         display_grid(
@@ -1672,20 +1725,14 @@ def run_spatial_nback_practice(n, num_trials=50, display_duration=None, isi=None
             break
 
         if response is not None:
-            if response == is_target:
-                correct_responses += 1
-            else:
-                incorrect_responses += 1
-            reaction_times.append(reaction_time)
+            hit = response == is_target
+            correct_responses += hit
+            incorrect_responses += not hit
         elif i >= n:
             lapses += 1
             last_lapse = True
 
-        nback_queue.append(pos)
-        if len(nback_queue) > n:
-            nback_queue.pop(0)
-
-        event.clearEvents()
+        event.clearEvents(eventType="keyboard")
 
     total_responses = correct_responses + incorrect_responses + lapses
     accuracy = (correct_responses / total_responses) * 100 if total_responses > 0 else 0
@@ -1728,14 +1775,15 @@ def run_dual_nback_practice(n, num_trials=50, display_duration=None, isi=None):
     global skip_to_next_stage
     grid_size = 3
     positions, images = generate_dual_nback_sequence(num_trials, 3, n, image_files)
-    nback_queue = []
     correct_responses = 0
     incorrect_responses = 0
     lapses = 0
-    reaction_times = []
 
     grid, outline = create_grid(win, grid_size)
     level_color = get_level_color(n)
+    for r in grid:
+        r.lineColor = level_color
+    outline.lineColor = level_color
     level_text = visual.TextStim(
         win,
         text=get_text("level_label", n=n),
@@ -1743,6 +1791,14 @@ def run_dual_nback_practice(n, num_trials=50, display_duration=None, isi=None):
         height=24,
         pos=(-450, 350),
     )
+    lapse_stim = visual.TextStim(
+        win, text=get_text("lapse_feedback"), color="orange", pos=(0, -350)
+    )
+    # Load this block's images before the first trial (480 px grid, 10 px inset)
+    cell_size = 480 // grid_size - 10
+    block_images = {
+        img: get_image_stim(win, img, (cell_size, cell_size)) for img in set(images)
+    }
 
     draw_grid()
     visual.TextStim(
@@ -1758,40 +1814,35 @@ def run_dual_nback_practice(n, num_trials=50, display_duration=None, isi=None):
         skip_to_next_stage = True
 
     for i, (pos, img) in enumerate(zip(positions, images)):
-        if last_lapse:
-            lapse_feedback = get_text("lapse_feedback")
-            last_lapse = False
-        else:
-            lapse_feedback = None
+        lapse_feedback = last_lapse
+        last_lapse = False
 
         if skip_to_next_stage:
             break
 
-        is_target = (
-            len(nback_queue) >= n
-            and pos == nback_queue[-n][0]
-            and img == nback_queue[-n][1]
-        )
+        is_target = i >= n and pos == positions[i - n] and img == images[i - n]
 
         # Prepare stimulus object
         image_stim = display_dual_stimulus(
-            win, pos, img, grid_size, n_level=n, return_stim=True
+            win,
+            pos,
+            img,
+            grid_size,
+            n_level=n,
+            preloaded_images=block_images,
+            return_stim=True,
         )
 
         def draw_state():
             """Helper to draw the current grid state."""
             draw_grid()
             for r in grid:
-                r.lineColor = level_color
                 r.draw()
-            outline.lineColor = level_color
             outline.draw()
             if image_stim:
                 image_stim.draw()
             if lapse_feedback:
-                visual.TextStim(
-                    win, text=lapse_feedback, color="orange", pos=(0, -350)
-                ).draw()
+                lapse_stim.draw()
             level_text.draw()
 
         # 1. Presentation
@@ -1827,20 +1878,14 @@ def run_dual_nback_practice(n, num_trials=50, display_duration=None, isi=None):
             break
 
         if response is not None:
-            if response == is_target:
-                correct_responses += 1
-            else:
-                incorrect_responses += 1
-            reaction_times.append(reaction_time)
+            hit = response == is_target
+            correct_responses += hit
+            incorrect_responses += not hit
         elif i >= n:
             lapses += 1
             last_lapse = True
 
-        nback_queue.append((pos, img))
-        if len(nback_queue) > n:
-            nback_queue.pop(0)
-
-        event.clearEvents()
+        event.clearEvents(eventType="keyboard")
 
     total_responses = correct_responses + incorrect_responses + lapses
     accuracy = (correct_responses / total_responses) * 100 if total_responses > 0 else 0
@@ -1890,24 +1935,22 @@ def run_sequential_nback_practice(
         num_trials, n, target_percentage, image_files=image_files
     )
 
-    nback_queue = []
     correct_responses = 0
     incorrect_responses = 0
     lapses = 0
-    reaction_times = []
+    rt_sum = 0.0
+    rt_count = 0
     last_lapse = False
 
-    fixation = visual.TextStim(win, text="+", color="white", height=32)
-    level_text = visual.TextStim(
-        win,
-        text=get_text("level_label", n=n),
-        color="white",
-        height=24,
-        pos=(-450, 350),
+    background, isi_background = get_sequential_scenery(win, n)
+    # Load this block's images before the first trial
+    image_stims = [get_image_stim(win, img, (350, 350)) for img in images]
+    distractor_rect = visual.Rect(win, width=100, height=100, fillColor="white")
+    lapse_stim = visual.TextStim(
+        win, text=get_text("lapse_feedback"), color="orange", pos=(0, 200)
     )
 
-    draw_grid()
-    level_text.draw()
+    background.draw()
     visual.TextStim(win, text=get_text("no_response_needed", n=n), color="white").draw()
     win.flip()
     core.wait(2)
@@ -1920,50 +1963,54 @@ def run_sequential_nback_practice(
         if skip_to_next_stage:
             break
 
-        prompt = get_text("lapse_feedback") if (last_lapse and i >= n) else None
+        show_lapse = last_lapse and i >= n
         last_lapse = False
 
-        image_path = os.path.join(image_dir, img)
-        image_stim = visual.ImageStim(win, image=image_path, size=(350, 350))
+        image_stim = image_stims[i]
+        image_stim.pos = (0, 0)
+        is_target = i >= n and img == images[i - n]
 
         # 1. Presentation
-        draw_grid()
-        level_text.draw()
+        background.draw()
         image_stim.draw()
-        if prompt:
-            visual.TextStim(win, text=prompt, color="orange", pos=(0, 200)).draw()
+        if show_lapse:
+            lapse_stim.draw()
         win.flip()
         core.wait(display_duration)
 
         # 2. ISI
-        draw_grid()
-        level_text.draw()
-        fixation.draw()
+        isi_background.draw()
         win.flip()
 
         show_dist = DISTRACTORS_ENABLED and (i > 0) and (i % 12 == 0)
-        dist_ctx = {"shown": False}
+        # Distractor state machine: pending -> shown -> done. Each transition
+        # is a single flip, so key polling carries on while the square is up.
+        dist_ctx = {"state": "pending" if show_dist else "done", "feedback": None}
 
         def distractor_tick(t):
-            if show_dist and not dist_ctx["shown"] and t >= isi / 2:
-                draw_grid()
-                level_text.draw()
-                visual.Rect(win, width=100, height=100, fillColor="white").draw()
+            if dist_ctx["state"] == "pending" and t >= isi / 2:
+                background.draw()
+                distractor_rect.draw()
                 win.flip()
-                core.wait(0.2)
-                draw_grid()
-                level_text.draw()
-                fixation.draw()
+                dist_ctx["state"] = "shown"
+                dist_ctx["offset"] = t + 0.2
+            elif dist_ctx["state"] == "shown" and t >= dist_ctx["offset"]:
+                isi_background.draw()
+                if dist_ctx["feedback"] is not None:
+                    display_feedback(win, dist_ctx["feedback"])
                 win.flip()
-                dist_ctx["shown"] = True
+                dist_ctx["state"] = "done"
 
         def feedback_action(user_resp):
-            is_target = (len(nback_queue) >= n) and (img == nback_queue[-n])
-            # Draw existing state + feedback
-            draw_grid()
-            level_text.draw()
-            fixation.draw()
-            display_feedback(win, user_resp == is_target)
+            dist_ctx["feedback"] = user_resp == is_target
+            # Draw existing state + feedback; a distractor still on screen is
+            # redrawn so the response does not cut its 200 ms short
+            if dist_ctx["state"] == "shown":
+                background.draw()
+                distractor_rect.draw()
+            else:
+                isi_background.draw()
+            display_feedback(win, dist_ctx["feedback"])
             win.flip()
             # For Sequential, we leave the feedback on screen; common loop handles the timing
 
@@ -1982,25 +2029,20 @@ def run_sequential_nback_practice(
             break
 
         if response is not None:
-            is_target = (len(nback_queue) >= n) and (img == nback_queue[-n])
-            if response == is_target:
-                correct_responses += 1
-            else:
-                incorrect_responses += 1
-            reaction_times.append(reaction_time)
+            hit = response == is_target
+            correct_responses += hit
+            incorrect_responses += not hit
+            rt_sum += reaction_time
+            rt_count += 1
         elif i >= n:
             lapses += 1
             last_lapse = True
 
-        nback_queue.append(img)
-        if len(nback_queue) > n:
-            nback_queue.pop(0)
-
-        event.clearEvents()
+        event.clearEvents(eventType="keyboard")
 
     total_responses = correct_responses + incorrect_responses + lapses
     accuracy = (correct_responses / total_responses) * 100 if total_responses > 0 else 0
-    avg_rt = (sum(reaction_times) / len(reaction_times)) if reaction_times else 0
+    avg_rt = (rt_sum / rt_count) if rt_count else 0
     return accuracy, incorrect_responses, lapses, avg_rt
 
 